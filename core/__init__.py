@@ -42,7 +42,9 @@ from .parallel import ParallelExecutor, Task, TaskResult
 from .skills import SkillRegistry, Skill
 from .toon import (
     encode as toon_encode,
+    encode_to as toon_encode_to,
     decode as toon_decode,
+    decode_bytes as toon_decode_bytes,
     encode_compact as toon_encode_compact,
     decode_compact as toon_decode_compact,
     state_to_toon,
@@ -110,7 +112,9 @@ __all__ = [
 
     # TOON (Token-Oriented Object Notation)
     "toon_encode",
+    "toon_encode_to",
     "toon_decode",
+    "toon_decode_bytes",
     "toon_encode_compact",
     "toon_decode_compact",
     "state_to_toon",
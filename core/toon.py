@@ -19,9 +19,51 @@ Features:
 from __future__ import annotations
 
 import json
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, TextIO, Union
+
+# Separator used for dot-notation keys
+_SEP = "."
+
+# Priority fields emitted first by state_to_toon()
+_PRIORITY_FIELDS = (
+    "current_node", "stage", "user_request",
+    "understood_request", "approach", "ready_to_proceed",
+    "done", "error",
+)
+
+# Escape tables for string values (single-pass str.translate)
+_ESCAPE_TABLE_VERBOSE = str.maketrans({"\\": "\\\\", "\n": "\\n"})
+_ESCAPE_TABLE_COMPACT = str.maketrans({"\\": "\\\\", "\n": "\\n", "|": "\\|", ":": "\\:"})
+
+# Characters that require escaping; clean strings are returned untouched
+_ESCAPE_SET_VERBOSE = frozenset("\\\n")
+_ESCAPE_SET_COMPACT = frozenset("\\\n|:")
+
+# Reverse mapping for escape sequences produced by _encode_value
+_UNESCAPE_MAP = {"n": "\n", "|": "|", ":": ":", "\\": "\\"}
+_UNESCAPE_RE = re.compile(r"\\([n|:\\])")
+
+# Numbers recognised by _decode_value: an optional leading "-" and digits
+# with at most one "."; exponents, underscores and inf/nan stay strings
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?(?:\d+\.\d*|\.\d+)")
+
+# Line scanner for decode(). Line boundaries and whitespace match what
+# str.splitlines() and str.strip() would produce, so each match is one
+# stripped line classified as a comment/blank, a "key: value" pair or
+# continuation text.
+_LINE_BREAK_CHARS = r"\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_DECODE_LINE_RE = re.compile(
+    rf"[^\S{_LINE_BREAK_CHARS}]*"
+    rf"(?:#[^{_LINE_BREAK_CHARS}]*"
+    rf"|(?P<key>(?:[^:\s](?:[^:{_LINE_BREAK_CHARS}]*[^:\s])?)?)[^\S{_LINE_BREAK_CHARS}]*:"
+    rf"[^\S{_LINE_BREAK_CHARS}]*(?P<value>(?:\S(?:[^{_LINE_BREAK_CHARS}]*\S)?)?)"
+    rf"|(?P<text>\S(?:[^{_LINE_BREAK_CHARS}]*\S)?))?"
+    rf"[^\S{_LINE_BREAK_CHARS}]*(?:\r\n|[{_LINE_BREAK_CHARS}]|\Z)"
+)
 
 
 def encode(obj: Dict[str, Any], flatten: bool = True) -> str:
@@ -41,15 +83,36 @@ def encode(obj: Dict[str, Any], flatten: bool = True) -> str:
     if flatten:
         obj = _flatten(obj)
 
-    lines = []
+    parts: List[str] = []
     for key, value in obj.items():
         if value is None:
             continue
 
-        encoded_value = _encode_value(value)
-        lines.append(f"{key}: {encoded_value}")
+        parts += (str(key), ": ", _encode_value(value), "\n")
 
-    return "\n".join(lines) + "\n" if lines else ""
+    return "".join(parts)
+
+
+def encode_to(writer: TextIO, obj: Dict[str, Any], flatten: bool = True) -> None:
+    """Encode a dictionary into TOON format, writing lines to ``writer``.
+
+    Produces the same text as :func:`encode` without materializing the whole
+    payload, so it can feed a file or socket directly.
+
+    Args:
+        writer: Any object with a ``write(str)`` method (file, StringIO, ...)
+        obj: The dictionary to encode
+        flatten: If True, flatten nested dicts to dot-notation keys
+    """
+    if flatten:
+        obj = _flatten(obj)
+
+    write = writer.write
+    for key, value in obj.items():
+        if value is None:
+            continue
+
+        write(f"{key}: {_encode_value(value)}\n")
 
 
 def decode(payload: str, unflatten: bool = True) -> Dict[str, Any]:
@@ -68,25 +131,15 @@ def decode(payload: str, unflatten: bool = True) -> Dict[str, Any]:
     """
     result: Dict[str, Any] = {}
 
-    for raw_line in (payload or "").splitlines():
-        line = raw_line.strip()
-
-        # Skip empty lines and comments
-        if not line or line.startswith("#"):
-            continue
+    # Each match is one line; blank lines and comments match with no groups
+    for match in _DECODE_LINE_RE.finditer(payload or ""):
+        key, value, text = match.group("key", "value", "text")
 
-        # Handle lines without colons as continuation text
-        if ":" not in line:
-            result["_text"] = (result.get("_text", "") + "\n" + line).strip()
-            continue
-
-        # Split on first colon only
-        key, value = line.split(":", 1)
-        key = key.strip()
-        value = value.strip()
-
-        # Decode the value
-        result[key] = _decode_value(value)
+        if key is not None:
+            result[key] = _decode_value(value)
+        elif text is not None:
+            # Handle lines without colons as continuation text
+            result["_text"] = (result.get("_text", "") + "\n" + text).strip()
 
     if unflatten:
         result = _unflatten(result)
@@ -94,6 +147,24 @@ def decode(payload: str, unflatten: bool = True) -> Dict[str, Any]:
     return result
 
 
+def decode_bytes(payload: Union[bytes, bytearray, memoryview], unflatten: bool = True) -> Dict[str, Any]:
+    """Decode a UTF-8 encoded TOON payload straight from a bytes-like buffer.
+
+    Accepts bytes, bytearray or memoryview (e.g. a file or socket buffer) and
+    decodes it in one pass without an intermediate ``bytes`` copy; CPython's
+    UTF-8 decoder already takes an ASCII fast path for plain payloads. Line
+    handling is identical to :func:`decode`.
+
+    Args:
+        payload: The UTF-8 encoded TOON payload
+        unflatten: If True, unflatten dot-notation keys to nested dicts
+
+    Returns:
+        Decoded dictionary
+    """
+    return decode(str(payload, "utf-8"), unflatten=unflatten)
+
+
 def encode_compact(obj: Dict[str, Any]) -> str:
     """Encode to ultra-compact single-line format for maximum token savings.
 
@@ -101,16 +172,17 @@ def encode_compact(obj: Dict[str, Any]) -> str:
         >>> encode_compact({"a": 1, "b": "hello"})
         'a:1|b:hello'
     """
-    parts = []
+    parts: List[str] = []
     flat = _flatten(obj)
 
     for key, value in flat.items():
         if value is None:
             continue
-        encoded = _encode_value(value, compact=True)
-        parts.append(f"{key}:{encoded}")
+        parts += (str(key), ":", _encode_value(value, compact=True), "|")
 
-    return "|".join(parts)
+    if parts:
+        parts.pop()  # Drop the trailing separator
+    return "".join(parts)
 
 
 def decode_compact(payload: str) -> Dict[str, Any]:
@@ -136,34 +208,71 @@ def decode_compact(payload: str) -> Dict[str, Any]:
 
 def _encode_value(value: Any, compact: bool = False) -> str:
     """Encode a single value to TOON format."""
-    if value is None:
-        return "null"
+    # Exact-type lookup; types not seen before are resolved once and cached
+    value_type = type(value)
+    if value_type is str:
+        return _encode_str(value, compact)
+
+    encoder = _ENCODERS.get(value_type)
+    if encoder is None:
+        # str subclasses depend on ``compact`` so they are never cached;
+        # convert to a plain str so mixin enums don't format as "Cls.NAME"
+        if isinstance(value, str):
+            return _encode_str(str.__str__(value), compact)
+        encoder = _ENCODERS[value_type] = _resolve_encoder(value_type)
+    return encoder(value)
+
+
+def _resolve_encoder(value_type: type) -> Callable[[Any], str]:
+    """Pick the encoder for a type not yet in ``_ENCODERS`` (e.g. an Enum subclass).
+
+    Runs the isinstance-style cascade once per type; the result is cached by
+    _encode_value so later values of the same type are a single dict lookup.
+    """
+    if issubclass(value_type, (int, float)):
+        return str
 
-    if isinstance(value, bool):
-        return "true" if value else "false"
+    if issubclass(value_type, datetime):
+        return value_type.isoformat
 
-    if isinstance(value, (int, float)):
-        return str(value)
+    if issubclass(value_type, Enum):
+        return lambda value: str(value.value)
 
-    if isinstance(value, str):
-        # Escape newlines and pipes (for compact format)
-        escaped = value.replace("\\", "\\\\").replace("\n", "\\n")
-        if compact:
-            escaped = escaped.replace("|", "\\|").replace(":", "\\:")
-        return escaped
+    if issubclass(value_type, (list, dict)):
+        return _encode_json
 
-    if isinstance(value, datetime):
-        return value.isoformat()
+    # Fallback to string representation
+    return str
 
-    if isinstance(value, Enum):
-        return str(value.value)
 
-    if isinstance(value, (list, dict)):
-        # Use compact JSON for complex types
-        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+def _encode_str(value: str, compact: bool = False) -> str:
+    """Escape a string value, returning it untouched when nothing needs escaping."""
+    # Escape newlines and pipes (for compact format)
+    if compact:
+        if _ESCAPE_SET_COMPACT.isdisjoint(value):
+            return value
+        return value.translate(_ESCAPE_TABLE_COMPACT)
+    if _ESCAPE_SET_VERBOSE.isdisjoint(value):
+        return value
+    return value.translate(_ESCAPE_TABLE_VERBOSE)
+
+
+def _encode_json(value: Any) -> str:
+    """Use compact JSON for complex types."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
 
-    # Fallback to string representation
-    return str(value)
+
+# Encoders keyed by exact type; bool is listed explicitly so it never
+# resolves to the int encoder. Other types are added on first use.
+_ENCODERS = {
+    type(None): lambda value: "null",
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+    datetime: datetime.isoformat,
+    list: _encode_json,
+    dict: _encode_json,
+}
 
 
 def _decode_value(value: str) -> Any:
@@ -186,38 +295,58 @@ def _decode_value(value: str) -> Any:
         except json.JSONDecodeError:
             pass
 
-    # Try to parse as number
-    if value.replace(".", "", 1).replace("-", "", 1).isdigit():
+    # Try to parse as number; the leading-character gate keeps free text
+    # away from the number patterns entirely
+    first = value[0]
+    if first == "-" or first == "." or first.isdigit():
         try:
-            if "." in value:
+            if _INT_RE.fullmatch(value):
+                return int(value)
+            if _FLOAT_RE.fullmatch(value):
                 return float(value)
-            return int(value)
         except ValueError:
             pass
 
     # Unescape string
-    return value.replace("\\n", "\n").replace("\\|", "|").replace("\\:", ":").replace("\\\\", "\\")
+    if "\\" not in value:
+        return value
+    return _UNESCAPE_RE.sub(lambda m: _UNESCAPE_MAP[m.group(1)], value)
 
 
-def _flatten(obj: Dict[str, Any], parent_key: str = "", sep: str = ".") -> Dict[str, Any]:
+def _flatten(obj: Dict[str, Any]) -> Dict[str, Any]:
     """Flatten a nested dictionary to dot-notation keys.
 
+    Walks an explicit stack of ``(prefix, items iterator)`` pairs and writes
+    every leaf straight into a single output dict, so key order matches the
+    depth-first traversal of the input. Prefixes carry their trailing
+    separator so child keys are built with a single concatenation.
+
     Example:
         >>> _flatten({"a": {"b": 1, "c": 2}})
         {'a.b': 1, 'a.c': 2}
     """
-    items: List[tuple] = []
-
-    for key, value in obj.items():
-        new_key = f"{parent_key}{sep}{key}" if parent_key else key
-
-        if isinstance(value, dict) and value:
-            # Recursively flatten nested dicts
-            items.extend(_flatten(value, new_key, sep).items())
+    out: Dict[str, Any] = {}
+    stack: List[tuple] = [("", iter(obj.items()))]
+
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            if not prefix:
+                new_key = key
+            elif type(key) is str:
+                new_key = prefix + key
+            else:
+                new_key = f"{prefix}{key}"
+
+            if isinstance(value, dict) and value:
+                # Descend into the nested dict; resume this level afterwards
+                stack.append((f"{new_key}{_SEP}" if new_key else "", iter(value.items())))
+                break
+            out[new_key] = value
         else:
-            items.append((new_key, value))
+            stack.pop()
 
-    return dict(items)
+    return out
 
 
 def _unflatten(obj: Dict[str, Any], sep: str = ".") -> Dict[str, Any]:
@@ -262,36 +391,59 @@ def state_to_toon(state_data: Dict[str, Any], max_depth: int = 3) -> str:
     Returns:
         TOON-formatted state string
     """
-    # Priority fields to include first
-    priority_fields = [
-        "current_node", "stage", "user_request",
-        "understood_request", "approach", "ready_to_proceed",
-        "done", "error"
-    ]
-
     # Truncate and limit the data
     truncated = _truncate_for_context(state_data, max_depth)
 
     # Build output with priority fields first
-    lines = []
+    parts: List[str] = []
     flat = _flatten(truncated)
 
-    # Add priority fields first
-    for field in priority_fields:
-        for key in list(flat.keys()):
-            if key == field or key.endswith(f".{field}"):
-                lines.append(f"{key}: {_encode_value(flat.pop(key))}")
-
-    # Add remaining fields
+    # Bin keys by their last segment in a single pass so priority fields
+    # (exact or as a ".field" suffix) can be emitted first
+    priority: Dict[str, List[tuple]] = {field: [] for field in _PRIORITY_FIELDS}
+    remaining: List[tuple] = []
     for key, value in flat.items():
-        lines.append(f"{key}: {_encode_value(value)}")
+        bucket = priority.get(key.rpartition(_SEP)[2])
+        (remaining if bucket is None else bucket).append((key, value))
 
-    return "\n".join(lines) + "\n" if lines else ""
+    # Add priority fields first, then remaining fields
+    for bucket in (*priority.values(), remaining):
+        for key, value in bucket:
+            parts += (key, ": ", _encode_value(value), "\n")
+
+    return "".join(parts)
 
 
 def _truncate_for_context(obj: Any, max_depth: int, current_depth: int = 0) -> Any:
-    """Truncate data for LLM context to save tokens."""
-    if current_depth >= max_depth:
+    """Truncate data for LLM context to save tokens.
+
+    Containers are copied with an explicit work stack instead of recursion:
+    each entry pairs a source container with the (initially empty) copy that
+    its truncated children are written into.
+    """
+    stack: List[tuple] = []
+    result = _truncate_node(obj, max_depth, current_depth, stack)
+
+    while stack:
+        source, target, depth = stack.pop()
+        child_depth = depth + 1
+
+        if isinstance(target, dict):
+            for k, v in source.items():
+                target[k] = _truncate_node(v, max_depth, child_depth, stack)
+            continue
+
+        for v in source[:10]:
+            target.append(_truncate_node(v, max_depth, child_depth, stack))
+        if len(source) > 10:
+            target.append(f"...and {len(source) - 10} more")
+
+    return result
+
+
+def _truncate_node(obj: Any, max_depth: int, depth: int, stack: List[tuple]) -> Any:
+    """Truncate a single value; containers are queued on ``stack`` to be filled."""
+    if depth >= max_depth:
         if isinstance(obj, dict):
             return f"{{...{len(obj)} keys}}"
         if isinstance(obj, list):
@@ -301,22 +453,16 @@ def _truncate_for_context(obj: Any, max_depth: int, current_depth: int = 0) -> A
         return obj
 
     if isinstance(obj, dict):
-        return {
-            k: _truncate_for_context(v, max_depth, current_depth + 1)
-            for k, v in obj.items()
-        }
-
-    if isinstance(obj, list):
-        if len(obj) > 10:
-            truncated = [_truncate_for_context(v, max_depth, current_depth + 1) for v in obj[:10]]
-            truncated.append(f"...and {len(obj) - 10} more")
-            return truncated
-        return [_truncate_for_context(v, max_depth, current_depth + 1) for v in obj]
-
-    if isinstance(obj, str) and len(obj) > 500:
-        return obj[:500] + "..."
-
-    return obj
+        target: Any = {}
+    elif isinstance(obj, list):
+        target = []
+    else:
+        if isinstance(obj, str) and len(obj) > 500:
+            return obj[:500] + "..."
+        return obj
+
+    stack.append((obj, target, depth))
+    return target
 
 
 # Aliases for backward compatibility with codex_brain_factory naming
@@ -18,6 +18,8 @@ Based on lessons learned from the Casey Optical Too workflow errors:
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
@@ -79,6 +81,28 @@ RECOMMENDED_MUST_NOT_PATTERNS = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _pattern_scanner(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile patterns into a single scanner that reports overlapping hits.
+
+    The alternation sits inside a lookahead so every start position is tried
+    (like an Aho-Corasick pass), and longer patterns are listed first.
+    """
+    ordered = sorted(patterns, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+
+
+def _missing_patterns(text: str, patterns: List[str]) -> List[str]:
+    """Return the patterns that do not occur in text, in their original order.
+
+    Equivalent to ``[p for p in patterns if p not in text]`` but scans the
+    text once.
+    """
+    found = {m.group(1) for m in _pattern_scanner(tuple(patterns)).finditer(text)}
+    # A pattern that is a prefix of a longer hit at the same position is a hit too
+    return [p for p in patterns if not any(hit.startswith(p) for hit in found)]
+
+
 def validate_brain_structure(brain_path: Path) -> ValidationResult:
     """
     Validate that a brain directory has the required structure.
@@ -99,6 +123,18 @@ def validate_brain_structure(brain_path: Path) -> ValidationResult:
     """
     result = ValidationResult(valid=True)
 
+    # One directory listing per level instead of a stat() per expected path
+    entries = _list_entries(brain_path)
+    listed: Dict[str, set] = {"": entries}
+
+    def exists(relative: str) -> bool:
+        parent, _, name = relative.rpartition("/")
+        if parent not in listed:
+            listed[parent] = (
+                _list_entries(brain_path / parent) if parent in entries else set()
+            )
+        return name in listed[parent]
+
     # Required files
     required_files = [
         ("brain.yaml", "Brain manifest"),
@@ -106,8 +142,7 @@ def validate_brain_structure(brain_path: Path) -> ValidationResult:
     ]
 
     for filename, description in required_files:
-        file_path = brain_path / filename
-        if not file_path.exists():
+        if not exists(filename):
             result.add_error(f"Missing required file: {filename} ({description})")
 
     # Recommended files
@@ -117,8 +152,7 @@ def validate_brain_structure(brain_path: Path) -> ValidationResult:
     ]
 
     for filename, description in recommended_files:
-        file_path = brain_path / filename
-        if not file_path.exists():
+        if not exists(filename):
             result.add_warning(f"Missing recommended file: {filename} ({description})")
 
     # Recommended directories
@@ -129,13 +163,27 @@ def validate_brain_structure(brain_path: Path) -> ValidationResult:
     ]
 
     for dirname, description in recommended_dirs:
-        dir_path = brain_path / dirname
-        if not dir_path.exists():
+        if not exists(dirname):
             result.add_suggestion(f"Consider adding: {dirname}/ ({description})")
 
     return result
 
 
+def _list_entries(dir_path: Path) -> set:
+    """Return the names of existing entries in a directory (empty if unreadable).
+
+    Broken symlinks are left out so membership matches ``Path.exists()``.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return {
+                entry.name for entry in it
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            }
+    except OSError:
+        return set()
+
+
 def validate_stop_rules(manifest: BrainManifest) -> ValidationResult:
     """
     Validate that a brain has appropriate stop rules.
@@ -164,11 +212,10 @@ def validate_stop_rules(manifest: BrainManifest) -> ValidationResult:
     # Check for recommended patterns
     rule_text = " ".join(sr.condition.lower() for sr in manifest.stop_rules)
 
-    for pattern in RECOMMENDED_STOP_RULE_PATTERNS:
-        if pattern not in rule_text:
-            result.add_suggestion(
-                f"Consider adding stop rule for '{pattern}' conditions"
-            )
+    for pattern in _missing_patterns(rule_text, RECOMMENDED_STOP_RULE_PATTERNS):
+        result.add_suggestion(
+            f"Consider adding stop rule for '{pattern}' conditions"
+        )
 
     # Check that stop rules have actions defined
     for i, sr in enumerate(manifest.stop_rules):
@@ -212,20 +259,18 @@ def validate_constraints(manifest: BrainManifest) -> ValidationResult:
     # Check for recommended patterns in must_do
     if must_do:
         must_do_text = " ".join(c.description.lower() for c in must_do)
-        for pattern in RECOMMENDED_MUST_DO_PATTERNS:
-            if pattern not in must_do_text:
-                result.add_suggestion(
-                    f"Consider adding must_do constraint for '{pattern}'"
-                )
+        for pattern in _missing_patterns(must_do_text, RECOMMENDED_MUST_DO_PATTERNS):
+            result.add_suggestion(
+                f"Consider adding must_do constraint for '{pattern}'"
+            )
 
     # Check for recommended patterns in must_not
     if must_not:
         must_not_text = " ".join(c.description.lower() for c in must_not)
-        for pattern in RECOMMENDED_MUST_NOT_PATTERNS:
-            if pattern not in must_not_text:
-                result.add_suggestion(
-                    f"Consider adding must_not constraint for '{pattern}'"
-                )
+        for pattern in _missing_patterns(must_not_text, RECOMMENDED_MUST_NOT_PATTERNS):
+            result.add_suggestion(
+                f"Consider adding must_not constraint for '{pattern}'"
+            )
 
     return result
 
@@ -392,7 +437,8 @@ def validate_brain_has_template_rules(manifest: BrainManifest) -> ValidationResu
     # Check stop rules for template-related conditions
     has_template_stop = False
     for sr in manifest.stop_rules:
-        if "template" in sr.condition.lower() and "missing" in sr.condition.lower():
+        condition = sr.condition.lower()
+        if "template" in condition and "missing" in condition:
             has_template_stop = True
             break
 
@@ -450,7 +496,8 @@ def validate_brain_has_pricing_rules(manifest: BrainManifest) -> ValidationResul
     # Check for minimum enforcements related to pricing
     has_pricing_enforcement = False
     for me in manifest.minimum_enforcements:
-        if "pricing" in me.field.lower() or "weekly" in me.field.lower():
+        field_name = me.field.lower()
+        if "pricing" in field_name or "weekly" in field_name:
             has_pricing_enforcement = True
             break
 
@@ -462,7 +509,8 @@ def validate_brain_has_pricing_rules(manifest: BrainManifest) -> ValidationResul
     # Check for stop rule about pricing below minimum
     has_pricing_stop = False
     for sr in manifest.stop_rules:
-        if "pricing" in sr.condition.lower() and "minimum" in sr.condition.lower():
+        condition = sr.condition.lower()
+        if "pricing" in condition and "minimum" in condition:
             has_pricing_stop = True
             break
 
@@ -0,0 +1,68 @@
+"""
+Markdown patterns shared by render_verify.py and generate_template_contract.py.
+
+Both scripts are run directly (`python scripts/<name>.py`), so `scripts/` is on sys.path
+and they import this module by its top-level name. Keeping one copy of the image-ref
+parsing and slide counting prevents the template contract and the render check from
+drifting apart.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterator
+
+
+UNREPLACED_TOKEN_RE = re.compile(r"\{\{[A-Z0-9_]+\}\}")
+PLACEHOLDER_RE = re.compile(r"\{\{([A-Z0-9_]+)\}\}")
+MD_IMAGE_RE = re.compile(r"!\[[^\]]*]\(([^)]+)\)")
+HTML_IMAGE_RE = re.compile(r"<img[^>]+src=['\"]([^'\"]+)['\"][^>]*>", re.IGNORECASE)
+
+
+def normalize_md_link_target(raw: str) -> str:
+    target = raw.strip()
+
+    # Handle <path with spaces>
+    if target.startswith("<") and target.endswith(">"):
+        target = target[1:-1].strip()
+
+    # Remove optional title: (path "title")
+    target = target.split()[0].strip()
+    target = target.strip("'\"")
+    return target
+
+
+def iter_image_refs(text: str) -> Iterator[str]:
+    """
+    Yield image refs as written (not URL-decoded): markdown `![](...)` targets first,
+    then HTML `<img src=...>` values. May yield duplicates and empty strings.
+    """
+    for m in MD_IMAGE_RE.finditer(text):
+        yield normalize_md_link_target(m.group(1))
+
+    for m in HTML_IMAGE_RE.finditer(text):
+        yield m.group(1).strip()
+
+
+def md_slide_separators_count(md_text: str) -> int:
+    """
+    Best-effort slide count for a Marp markdown file:
+    - ignore YAML frontmatter fenced by leading '---' ... '---'
+    - count slide separators as lines that are exactly '---'
+    """
+    # Strip and count at C level (map / list.index / list.count) instead of per-line Python.
+    lines = list(map(str.strip, md_text.splitlines()))
+    i = 0
+
+    # Skip leading empty lines
+    while i < len(lines) and not lines[i]:
+        i += 1
+
+    # Detect YAML frontmatter; an unterminated one swallows the rest of the file.
+    if i < len(lines) and lines[i] == "---":
+        try:
+            i = lines.index("---", i + 1) + 1
+        except ValueError:
+            return 0
+
+    return lines[i:].count("---") if i else lines.count("---")
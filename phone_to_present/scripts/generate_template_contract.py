@@ -16,10 +16,16 @@ import re
 from pathlib import Path
 from urllib.parse import unquote
 
+from _marp_re import PLACEHOLDER_RE, iter_image_refs, md_slide_separators_count, normalize_md_link_target
 
-PLACEHOLDER_RE = re.compile(r"\{\{([A-Z0-9_]+)\}\}")
-MD_IMAGE_RE = re.compile(r"!\[[^\]]*]\(([^)]+)\)")
-HTML_IMAGE_RE = re.compile(r"<img[^>]+src=['\"]([^'\"]+)['\"][^>]*>", re.IGNORECASE)
+
+# The _marp_re placeholder / markdown-image / <img> patterns fused into one alternation
+# (IGNORECASE scoped to the <img> branch).
+TEMPLATE_TOKEN_RE = re.compile(
+    r"(?P<ph>\{\{[A-Z0-9_]+\}\})"
+    r"|!\[[^\]]*]\((?P<md>[^)]+)\)"
+    r"|(?i:<img[^>]+src=['\"](?P<html>[^'\"]+)['\"][^>]*>)"
+)
 
 
 def sha256_text(text: str) -> str:
@@ -27,8 +33,10 @@ def sha256_text(text: str) -> str:
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashing loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
@@ -38,79 +46,79 @@ def extract_placeholders(text: str) -> list[str]:
     return sorted(set(PLACEHOLDER_RE.findall(text)))
 
 
-def _normalize_md_link_target(raw: str) -> str:
-    target = raw.strip()
-    if target.startswith("<") and target.endswith(">"):
-        target = target[1:-1].strip()
-    target = target.split()[0].strip()
-    target = target.strip("'\"")
-    return unquote(target)
-
-
 def extract_image_refs(text: str) -> list[str]:
-    refs: set[str] = set()
-    for m in MD_IMAGE_RE.finditer(text):
-        refs.add(_normalize_md_link_target(m.group(1)))
-    for m in HTML_IMAGE_RE.finditer(text):
-        refs.add(unquote(m.group(1).strip()))
+    refs = {unquote(ref) for ref in iter_image_refs(text)}
     return sorted(r for r in refs if r)
 
 
-def md_slide_separators_count(md_text: str) -> int:
+def scan_template(text: str) -> tuple[list[str], list[str]]:
     """
-    Best-effort slide count for a Marp markdown file:
-    - ignore YAML frontmatter fenced by leading '---' ... '---'
-    - count slide separators as lines that are exactly '---'
-    """
-    lines = md_text.splitlines()
-    i = 0
-
-    while i < len(lines) and not lines[i].strip():
-        i += 1
-
-    if i < len(lines) and lines[i].strip() == "---":
-        i += 1
-        while i < len(lines) and lines[i].strip() != "---":
-            i += 1
-        if i < len(lines) and lines[i].strip() == "---":
-            i += 1
+    Single-pass equivalent of (extract_placeholders(text), extract_image_refs(text)).
 
-    seps = 0
-    for line in lines[i:]:
-        if line.strip() == "---":
-            seps += 1
-    return seps
+    Placeholders inside an image match are recovered by rescanning that match. An image
+    ref nested inside another kind of image ref would be consumed by the outer match, so
+    those (pathological) templates fall back to the separate scans.
+    """
+    placeholders: set[str] = set()
+    refs: set[str] = set()
+    for m in TEMPLATE_TOKEN_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == "ph":
+            placeholders.add(m.group("ph")[2:-2])
+            continue
+        span = m.group(0)
+        if kind == "md":
+            if "<" in span:
+                return extract_placeholders(text), extract_image_refs(text)
+            refs.add(unquote(normalize_md_link_target(m.group("md"))))
+        else:
+            if "![" in span:
+                return extract_placeholders(text), extract_image_refs(text)
+            refs.add(unquote(m.group("html").strip()))
+        if "{{" in span:
+            placeholders.update(PLACEHOLDER_RE.findall(span))
+    return sorted(placeholders), sorted(r for r in refs if r)
+
+
+def _bullets(items: list[str]) -> str:
+    return "".join(f"- `{item}`\n" for item in items)
 
 
 def render_markdown_contract(*, template_rel: str, template_text: str) -> str:
-    placeholders = extract_placeholders(template_text)
-    images = extract_image_refs(template_text)
+    placeholders, images = scan_template(template_text)
     charts = [p for p in images if p.startswith("charts/")]
     other_assets = [p for p in images if not p.startswith("charts/")]
     slide_est = md_slide_separators_count(template_text) + 1
 
-    lines: list[str] = []
-    lines.append("# Template Contract (Generated)")
-    lines.append("")
-    lines.append(f"- Template: `{template_rel}`")
-    lines.append(f"- Template SHA256: `{sha256_text(template_text)}`")
-    lines.append(f"- Slide count estimate: `{slide_est}`")
-    lines.append("")
-    lines.append("## Required Placeholders")
-    for p in placeholders:
-        lines.append(f"- `{p}`")
-    lines.append("")
-    lines.append("## Required Local Assets")
-    lines.append("### Charts (template-referenced)")
-    for p in charts:
-        lines.append(f"- `{p}`")
-    if other_assets:
-        lines.append("")
-        lines.append("### Other Images")
-        for p in other_assets:
-            lines.append(f"- `{p}`")
-    lines.append("")
-    return "\n".join(lines) + "\n"
+    other_section = f"\n### Other Images\n{_bullets(other_assets)}" if other_assets else ""
+    return (
+        "# Template Contract (Generated)\n"
+        "\n"
+        f"- Template: `{template_rel}`\n"
+        f"- Template SHA256: `{sha256_text(template_text)}`\n"
+        f"- Slide count estimate: `{slide_est}`\n"
+        "\n"
+        "## Required Placeholders\n"
+        f"{_bullets(placeholders)}"
+        "\n"
+        "## Required Local Assets\n"
+        "### Charts (template-referenced)\n"
+        f"{_bullets(charts)}"
+        f"{other_section}"
+        "\n"
+    )
+
+
+def contract_cache_key(*, template_rel: str, template_text: str) -> str:
+    """
+    Everything the generated contract depends on: the template path + text and the
+    generator source itself (so a change to this script invalidates cached output).
+    """
+    h = hashlib.sha256()
+    for src in (Path(__file__), Path(__file__).with_name("_marp_re.py")):
+        h.update(src.read_bytes())
+    h.update(template_rel.encode("utf-8") + b"\0" + template_text.encode("utf-8"))
+    return h.hexdigest()
 
 
 def main() -> None:
@@ -134,13 +142,22 @@ def main() -> None:
         raise SystemExit(f"Template not found: {template_path}")
 
     template_text = template_path.read_text(encoding="utf-8")
-    contract = render_markdown_contract(template_rel=str(template_path), template_text=template_text)
-
     out_path: Path = args.out
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(contract, encoding="utf-8")
 
-    print(f"[OK] Wrote template contract: {out_path}")
+    # Sidecar records "<input key> <output sha256>"; skip regeneration when neither the
+    # inputs nor the previously written contract have changed.
+    cache_path = out_path.with_name(out_path.name + ".src.sha256")
+    cache_key = contract_cache_key(template_rel=str(template_path), template_text=template_text)
+    cached = cache_path.read_text(encoding="utf-8").split() if cache_path.exists() else []
+    if cached and cached[0] == cache_key and out_path.exists() and cached[1:] == [sha256_file(out_path)]:
+        print(f"[OK] Template contract up to date: {out_path}")
+    else:
+        contract = render_markdown_contract(template_rel=str(template_path), template_text=template_text)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(contract, encoding="utf-8")
+        cache_path.write_text(f"{cache_key} {sha256_file(out_path)}\n", encoding="utf-8")
+        print(f"[OK] Wrote template contract: {out_path}")
+
     print(f"[OK] Template file SHA256: {sha256_file(template_path)}")
 
 
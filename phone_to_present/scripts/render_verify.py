@@ -15,25 +15,32 @@ import argparse
 import hashlib
 import io
 import json
+import math
+import os
 import re
+import shutil
 import subprocess
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import unquote
 
-import numpy as np
-from PIL import Image, ImageChops, ImageFilter
+from _marp_re import UNREPLACED_TOKEN_RE, iter_image_refs, md_slide_separators_count
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# numpy / PIL are imported inside the functions that need them, so runs that fail an
+# early text check (unreplaced tokens, missing images) exit without paying for them.
 
-UNREPLACED_TOKEN_RE = re.compile(r"\{\{[A-Z0-9_]+\}\}")
-MD_IMAGE_RE = re.compile(r"!\[[^\]]*]\(([^)]+)\)")
-HTML_IMAGE_RE = re.compile(r"<img[^>]+src=['\"]([^'\"]+)['\"][^>]*>", re.IGNORECASE)
 PPTX_SLIDE_RE = re.compile(r"^ppt/slides/slide\d+\.xml$")
 PPTX_SLIDE_IMAGE_RE = re.compile(r"^ppt/media/Slide-(\d+)-image-1\.(png|jpe?g)$", re.IGNORECASE)
 URL_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
-CORE_XML_CREATED_RE = re.compile(r"(<dcterms:created[^>]*>)[^<]+(</dcterms:created>)")
-CORE_XML_MODIFIED_RE = re.compile(r"(<dcterms:modified[^>]*>)[^<]+(</dcterms:modified>)")
+CORE_XML_DATES_RE = re.compile(r"(<dcterms:(created|modified)[^>]*>)[^<]+(</dcterms:\2>)")
 FIXED_RENDERED_AT = "1980-01-01T00:00:00Z"
 
 EMOJI_RANGES: tuple[tuple[int, int], ...] = (
@@ -50,6 +57,24 @@ EMOJI_RANGES: tuple[tuple[int, int], ...] = (
     (0x2600, 0x26FF),  # misc symbols
     (0x2700, 0x27BF),  # dingbats
 )
+EMOJI_SINGLETONS: tuple[int, ...] = (0xFE0F, 0x200D)  # variation selector-16, zero-width joiner
+
+
+@lru_cache(maxsize=None)
+def _emoji_lut() -> np.ndarray:
+    """
+    Boolean lookup table indexed by codepoint: True for EMOJI_RANGES and EMOJI_SINGLETONS.
+    It stops just past the highest emoji codepoint (~128 KB); the extra final False entry is
+    where out-of-range codepoints land when indexed with mode="clip".
+    """
+    import numpy as np
+
+    top = max(max(hi for _, hi in EMOJI_RANGES), max(EMOJI_SINGLETONS))
+    lut = np.zeros(top + 2, dtype=bool)
+    for lo, hi in EMOJI_RANGES:
+        lut[lo : hi + 1] = True
+    lut[list(EMOJI_SINGLETONS)] = True
+    return lut
 
 
 @dataclass(frozen=True)
@@ -60,8 +85,10 @@ class FileInfo:
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashing loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
@@ -75,9 +102,14 @@ def file_info(path: Path) -> FileInfo:
     )
 
 
-def marp_version(marp_bin: str) -> str:
-    proc = subprocess.run([marp_bin, "--version"], capture_output=True, text=True)
-    out = (proc.stdout or proc.stderr or "").strip()
+def start_marp_version(marp_bin: str) -> subprocess.Popen[str]:
+    """Spawn `marp --version` without waiting, so its Node startup overlaps the renders."""
+    return subprocess.Popen([marp_bin, "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def marp_version(proc: subprocess.Popen[str]) -> str:
+    stdout, stderr = proc.communicate()
+    out = (stdout or stderr or "").strip()
     return out
 
 
@@ -100,24 +132,29 @@ def extract_unreplaced_tokens(text: str) -> list[str]:
     return sorted(set(UNREPLACED_TOKEN_RE.findall(text)))
 
 
-def is_emoji_char(ch: str) -> bool:
-    cp = ord(ch)
-    if cp in {0xFE0F, 0x200D}:  # variation selector-16, zero-width joiner
-        return True
-    for lo, hi in EMOJI_RANGES:
-        if lo <= cp <= hi:
-            return True
-    return False
-
-
 def find_emoji_lines(text: str, *, max_lines: int = 50) -> list[str]:
     """
     Return human-readable violations with 1-based line numbers.
     Conservative check: reject common emoji codepoint ranges + VS16/ZWJ sequences.
     """
+    # Every emoji codepoint is non-ASCII, and most decks are pure ASCII.
+    if text.isascii():
+        return []
+
+    import numpy as np
+
+    # Classify every codepoint in one vectorized pass; most decks have none at all.
+    cps = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    hits = _emoji_lut().take(cps, mode="clip")
+    if not hits.any():
+        return []
+    found = {text[i] for i in np.flatnonzero(hits)}
+
     violations: list[str] = []
     for i, line in enumerate(text.splitlines(), start=1):
-        emojis = sorted({ch for ch in line if is_emoji_char(ch)})
+        if line.isascii():
+            continue
+        emojis = sorted(found.intersection(line))
         if not emojis:
             continue
         snippet = line.strip()
@@ -129,29 +166,8 @@ def find_emoji_lines(text: str, *, max_lines: int = 50) -> list[str]:
     return violations
 
 
-def _normalize_md_link_target(raw: str) -> str:
-    target = raw.strip()
-
-    # Handle <path with spaces>
-    if target.startswith("<") and target.endswith(">"):
-        target = target[1:-1].strip()
-
-    # Remove optional title: (path "title")
-    target = target.split()[0].strip()
-    target = target.strip("'\"")
-    return target
-
-
 def extract_image_refs(text: str) -> list[str]:
-    refs: set[str] = set()
-
-    for m in MD_IMAGE_RE.finditer(text):
-        refs.add(_normalize_md_link_target(m.group(1)))
-
-    for m in HTML_IMAGE_RE.finditer(text):
-        refs.add(m.group(1).strip())
-
-    return sorted(refs)
+    return sorted(set(iter_image_refs(text)))
 
 
 def is_remote_ref(ref: str) -> bool:
@@ -169,10 +185,8 @@ def resolve_local_ref(md_path: Path, ref: str) -> Path:
     return (md_path.parent / candidate).resolve()
 
 
-def pptx_slide_count(pptx_path: Path) -> int:
-    with zipfile.ZipFile(pptx_path, "r") as z:
-        slides = [name for name in z.namelist() if PPTX_SLIDE_RE.match(name)]
-    return len(slides)
+def pptx_slide_count(z: zipfile.ZipFile) -> int:
+    return sum(1 for name in z.namelist() if PPTX_SLIDE_RE.match(name))
 
 
 def normalize_core_xml(xml_bytes: bytes, *, fixed_iso_utc: str) -> bytes:
@@ -185,8 +199,8 @@ def normalize_core_xml(xml_bytes: bytes, *, fixed_iso_utc: str) -> bytes:
     except Exception:
         return xml_bytes
 
-    text2 = CORE_XML_CREATED_RE.sub(rf"\\1{fixed_iso_utc}\\2", text)
-    text2 = CORE_XML_MODIFIED_RE.sub(rf"\\1{fixed_iso_utc}\\2", text2)
+    # One pass over both timestamps; a callback keeps the fixed value literal.
+    text2 = CORE_XML_DATES_RE.sub(lambda m: m.group(1) + fixed_iso_utc + m.group(3), text)
     return text2.encode("utf-8")
 
 
@@ -202,71 +216,92 @@ def normalize_pptx_for_determinism(pptx_path: Path) -> dict[str, str]:
     fixed_zip_dt = (1980, 1, 1, 0, 0, 0)  # minimum valid zip datetime
 
     tmp = pptx_path.with_suffix(".pptx.tmp")
-    with zipfile.ZipFile(pptx_path, "r") as zin:
-        entries: list[tuple[str, bytes, bool]] = []
-        for name in zin.namelist():
-            is_dir = name.endswith("/")
-            data = b"" if is_dir else zin.read(name)
-            if name == "docProps/core.xml" and not is_dir:
-                data = normalize_core_xml(data, fixed_iso_utc=fixed_iso)
-            entries.append((name, data, is_dir))
-
-    with zipfile.ZipFile(tmp, "w") as zout:
-        for name, data, is_dir in sorted(entries, key=lambda x: x[0]):
+    with zipfile.ZipFile(pptx_path, "r") as zin, zipfile.ZipFile(tmp, "w") as zout:
+        for src in sorted(zin.infolist(), key=lambda i: i.filename):
+            name = src.filename
             info = zipfile.ZipInfo(name)
             info.date_time = fixed_zip_dt
-            if is_dir:
+            if name.endswith("/"):
                 info.external_attr = 0o40775 << 16  # mark as directory on unixy unzip tools
                 zout.writestr(info, b"", compress_type=zipfile.ZIP_STORED)
-            else:
+            elif name == "docProps/core.xml":
+                data = normalize_core_xml(zin.read(name), fixed_iso_utc=fixed_iso)
                 zout.writestr(info, data, compress_type=zipfile.ZIP_DEFLATED)
+            else:
+                # Stream member to member (the bulk of a deck is media) instead of holding it in memory.
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.file_size = src.file_size  # lets open() choose zip64 headers the way writestr does
+                with zin.open(src) as fsrc, zout.open(info, "w") as fdst:
+                    shutil.copyfileobj(fsrc, fdst, 1 << 20)
 
     tmp.replace(pptx_path)
     return {"fixed_iso_utc": fixed_iso, "fixed_zip_datetime": "-".join(map(str, fixed_zip_dt))}
 
 
-def md_slide_separators_count(md_text: str) -> int:
+def extract_slide_images(z: zipfile.ZipFile) -> dict[int, zipfile.ZipInfo]:
     """
-    Best-effort slide count for a Marp markdown file:
-    - ignore YAML frontmatter fenced by leading '---' ... '---'
-    - count slide separators as lines that are exactly '---'
+    Marp PPTX exports commonly embed each slide as a full-slide image.
+    Locate those images keyed by slide number; callers read each member on demand
+    so only the slides currently being analyzed are held in memory.
     """
-    lines = md_text.splitlines()
-    i = 0
+    out: dict[int, zipfile.ZipInfo] = {}
+    for info in z.infolist():
+        m = PPTX_SLIDE_IMAGE_RE.match(info.filename)
+        if not m:
+            continue
+        slide_num = int(m.group(1))
+        out[slide_num] = info
+    return out
 
-    # Skip leading empty lines
-    while i < len(lines) and not lines[i].strip():
-        i += 1
 
-    # Detect YAML frontmatter
-    if i < len(lines) and lines[i].strip() == "---":
-        i += 1
-        while i < len(lines) and lines[i].strip() != "---":
-            i += 1
-        if i < len(lines) and lines[i].strip() == "---":
-            i += 1
+def _trimmed_extent(counts: np.ndarray, lo_pct: float, hi_pct: float) -> tuple[int, int]:
+    """
+    Trimmed extent of a mask along one axis, given its per-index pixel counts.
 
-    seps = 0
-    for line in lines[i:]:
-        if line.strip() == "---":
-            seps += 1
-    return seps
+    Equivalent to int(np.percentile(coords, lo_pct)), int(np.percentile(coords, hi_pct))
+    over the coordinates np.where would produce, without materializing them: the k-th
+    smallest coordinate is found by binary search on the cumulative counts.
+    Mirrors NumPy's default "linear" method, including its lerp rounding.
+    """
+    import numpy as np
 
+    cum = np.cumsum(counts)
+    n = int(cum[-1])
 
-def extract_slide_images(pptx_path: Path) -> dict[int, bytes]:
-    """
-    Marp PPTX exports commonly embed each slide as a full-slide image.
-    Extract those images keyed by slide number.
-    """
-    out: dict[int, bytes] = {}
-    with zipfile.ZipFile(pptx_path, "r") as z:
-        for name in z.namelist():
-            m = PPTX_SLIDE_IMAGE_RE.match(name)
-            if not m:
-                continue
-            slide_num = int(m.group(1))
-            out[slide_num] = z.read(name)
-    return out
+    def nth(k: int) -> int:
+        return int(np.searchsorted(cum, k, side="right"))
+
+    out: list[int] = []
+    for pct in (lo_pct, hi_pct):
+        virtual = (n - 1) * (pct / 100)
+        if virtual >= n - 1:
+            out.append(nth(n - 1))
+            continue
+        prev = math.floor(virtual)
+        gamma = virtual - prev
+        a, b = nth(prev), nth(prev + 1)
+        diff = b - a
+        out.append(int(b - diff * (1 - gamma) if gamma >= 0.5 else a + diff * gamma))
+    return out[0], out[1]
+
+
+@lru_cache(maxsize=None)
+def _load_cv2():
+    """OpenCV is optional: its SIMD GaussianBlur is several times faster than PIL's."""
+    try:
+        import cv2
+    except ImportError:
+        return None
+    return cv2
+
+
+def resolve_blur_backend(requested: str) -> str:
+    """Map --blur-backend (auto/pil/opencv) to the backend that will actually run."""
+    if requested == "auto":
+        return "opencv" if _load_cv2() is not None else "pil"
+    if requested == "opencv" and _load_cv2() is None:
+        raise SystemExit("--blur-backend opencv requested but OpenCV (cv2) is not installed.")
+    return requested
 
 
 def slide_content_margins(
@@ -276,6 +311,7 @@ def slide_content_margins(
     blur_radius: float = 3.0,
     diff_threshold: int = 20,
     trim_percentile: float = 1.0,
+    blur_backend: str = "pil",
 ) -> dict[str, int] | None:
     """
     Heuristic, deterministic margin check:
@@ -283,31 +319,67 @@ def slide_content_margins(
     - blur the image and take abs diff to highlight high-frequency content (text/tables/charts)
     - compute a trimmed bounding box of the diff mask to ignore tiny edge artifacts
 
+    blur_backend is "pil" or "opencv" (see resolve_blur_backend). The two Gaussian kernels
+    differ by a few intensity levels, so margins can shift by a pixel between backends;
+    the manifest records which one ran.
+
     Returns margins (left/top/right/bottom) in pixels at analysis_size, or None if no content was detected.
     """
-    img = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+    import numpy as np
+    from PIL import Image, ImageChops, ImageFilter
+
+    img = Image.open(io.BytesIO(image_bytes))
+    # JPEG slides can be decoded at a reduced DCT scale (never below analysis_size);
+    # a no-op for PNG, which is what Marp embeds.
+    img.draft("RGB", analysis_size)
+    img = img.convert("RGB")
     if img.size != analysis_size:
         img = img.resize(analysis_size, Image.Resampling.BILINEAR)
 
-    blurred = img.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+    if blur_backend == "opencv":
+        blurred = Image.fromarray(_load_cv2().GaussianBlur(np.asarray(img), (0, 0), blur_radius))
+    else:
+        blurred = img.filter(ImageFilter.GaussianBlur(radius=blur_radius))
     diff = ImageChops.difference(img, blurred).convert("L")
-    arr = np.array(diff, dtype=np.uint8)
+    arr = np.asarray(diff)  # mode "L" is already uint8; no dtype conversion pass
     mask = arr > diff_threshold
     if not mask.any():
         return None
 
-    ys, xs = np.where(mask)
     lo = float(trim_percentile)
     hi = 100.0 - lo
-    x1 = int(np.percentile(xs, lo))
-    x2 = int(np.percentile(xs, hi))
-    y1 = int(np.percentile(ys, lo))
-    y2 = int(np.percentile(ys, hi))
+    x1, x2 = _trimmed_extent(np.count_nonzero(mask, axis=0), lo, hi)
+    y1, y2 = _trimmed_extent(np.count_nonzero(mask, axis=1), lo, hi)
 
     w, h = analysis_size
     return {"left": x1, "top": y1, "right": (w - 1 - x2), "bottom": (h - 1 - y2)}
 
 
+def verify_slide_whitespace(
+    slide_num: int,
+    img_bytes: bytes | None,
+    margin_requirements: dict[str, int],
+    blur_backend: str = "pil",
+) -> tuple[dict[str, object] | None, dict[str, object] | None]:
+    """
+    Measure one slide image against the minimum margins.
+    Returns (per-slide row or None, violation or None) for the render manifest.
+    """
+    if img_bytes is None:
+        return None, {"slide": slide_num, "error": "Missing slide image in PPTX (cannot verify whitespace)."}
+
+    margins = slide_content_margins(img_bytes, blur_backend=blur_backend)
+    row = {"slide": slide_num, "margins": margins}
+
+    if margins is None:
+        return row, None
+
+    bad_edges = {k: {"actual": int(margins[k]), "min": int(margin_requirements[k])} for k in margin_requirements if margins[k] < margin_requirements[k]}
+    if bad_edges:
+        return row, {"slide": slide_num, "bad_edges": bad_edges, "margins": margins}
+    return row, None
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Render + verify a Marp deck from a populated markdown file.")
     parser.add_argument("md_path", type=Path, help="Path to populated Marp markdown (source of truth).")
@@ -316,6 +388,12 @@ def main() -> None:
     parser.add_argument("--min-right", type=int, default=40, help="Min right whitespace margin (px at 1280x720 analysis size).")
     parser.add_argument("--min-top", type=int, default=20, help="Min top whitespace margin (px at 1280x720 analysis size).")
     parser.add_argument("--min-bottom", type=int, default=20, help="Min bottom whitespace margin (px at 1280x720 analysis size).")
+    parser.add_argument(
+        "--blur-backend",
+        choices=("auto", "pil", "opencv"),
+        default="auto",
+        help="Blur used by the whitespace check (default: auto = OpenCV when installed, else PIL).",
+    )
     args = parser.parse_args()
 
     md_path: Path = args.md_path
@@ -359,8 +437,20 @@ def main() -> None:
     pptx_path = md_path.with_suffix(".pptx")
 
     # Render
-    run_marp(args.marp, md_path, html_path, ["--html"])
-    run_marp(args.marp, md_path, pptx_path, [])
+    version_proc = start_marp_version(args.marp)
+    try:
+        # The HTML and PPTX exports are independent Marp processes; run them side by side.
+        # Iterating the results in order re-raises the HTML failure first, as before.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            renders = [
+                executor.submit(run_marp, args.marp, md_path, html_path, ["--html"]),
+                executor.submit(run_marp, args.marp, md_path, pptx_path, []),
+            ]
+            for render in renders:
+                render.result()
+    finally:
+        # Reap `marp --version` as soon as the renders are done, even if one of them failed.
+        marp_ver = marp_version(version_proc)
 
     if not html_path.exists() or html_path.stat().st_size < 1000:
         raise SystemExit(f"HTML output missing/too small: {html_path}")
@@ -369,57 +459,61 @@ def main() -> None:
 
     normalization = normalize_pptx_for_determinism(pptx_path)
 
-    pptx_slides = pptx_slide_count(pptx_path)
-    if pptx_slides <= 0:
-        raise SystemExit("PPTX slide count is 0 (unexpected).")
-
-    md_seps = md_slide_separators_count(md_text)
-    # Approximate slide count: separators + 1 (post-frontmatter).
-    md_slides_est = md_seps + 1
-    if pptx_slides != md_slides_est:
-        raise SystemExit(
-            f"Slide count mismatch (PPTX vs markdown): pptx={pptx_slides}, md_estimate={md_slides_est}. "
-            "Check for malformed slide separators ('---') or Marp rendering errors."
-        )
-
-    # ------------------------------------------------------------------
-    # Slide-by-slide whitespace verification (PPTX slide images)
-    # ------------------------------------------------------------------
-    slide_images = extract_slide_images(pptx_path)
-    if not slide_images:
-        raise SystemExit(
-            "Could not find per-slide images inside the PPTX (expected Marp-style Slide-<n>-image-1.*).\n"
-            "Cannot run automated whitespace QA; open the PPTX and review slide-by-slide."
-        )
-
-    margin_requirements = {"left": args.min_left, "right": args.min_right, "top": args.min_top, "bottom": args.min_bottom}
-    slide_margin_rows: list[dict[str, object]] = []
-    margin_violations: list[dict[str, object]] = []
-
-    for slide_num in range(1, pptx_slides + 1):
-        img_bytes = slide_images.get(slide_num)
-        if img_bytes is None:
-            margin_violations.append(
-                {"slide": slide_num, "error": "Missing slide image in PPTX (cannot verify whitespace)."}
+    # One open of the PPTX serves the slide count and every (lazy) slide image read.
+    with zipfile.ZipFile(pptx_path, "r") as z:
+        pptx_slides = pptx_slide_count(z)
+        if pptx_slides <= 0:
+            raise SystemExit("PPTX slide count is 0 (unexpected).")
+
+        md_seps = md_slide_separators_count(md_text)
+        # Approximate slide count: separators + 1 (post-frontmatter).
+        md_slides_est = md_seps + 1
+        if pptx_slides != md_slides_est:
+            raise SystemExit(
+                f"Slide count mismatch (PPTX vs markdown): pptx={pptx_slides}, md_estimate={md_slides_est}. "
+                "Check for malformed slide separators ('---') or Marp rendering errors."
             )
-            continue
-
-        margins = slide_content_margins(img_bytes)
-        slide_margin_rows.append({"slide": slide_num, "margins": margins})
 
-        if margins is None:
-            continue
+        # ------------------------------------------------------------------
+        # Slide-by-slide whitespace verification (PPTX slide images)
+        # ------------------------------------------------------------------
+        slide_images = extract_slide_images(z)
+        if not slide_images:
+            raise SystemExit(
+                "Could not find per-slide images inside the PPTX (expected Marp-style Slide-<n>-image-1.*).\n"
+                "Cannot run automated whitespace QA; open the PPTX and review slide-by-slide."
+            )
 
-        bad_edges = {k: {"actual": int(margins[k]), "min": int(margin_requirements[k])} for k in margin_requirements if margins[k] < margin_requirements[k]}
-        if bad_edges:
-            margin_violations.append({"slide": slide_num, "bad_edges": bad_edges, "margins": margins})
+        blur_backend = resolve_blur_backend(args.blur_backend)
+        margin_requirements = {"left": args.min_left, "right": args.min_right, "top": args.min_top, "bottom": args.min_bottom}
+        slide_margin_rows: list[dict[str, object]] = []
+        margin_violations: list[dict[str, object]] = []
+
+        # Slides are independent; PIL/NumPy release the GIL, so threads parallelize the
+        # decode + blur work. executor.map preserves slide order for a stable manifest.
+        def check_slide(n: int) -> tuple[dict[str, object] | None, dict[str, object] | None]:
+            img_bytes = z.read(slide_images[n]) if n in slide_images else None
+            return verify_slide_whitespace(n, img_bytes, margin_requirements, blur_backend)
+
+        slide_nums = range(1, pptx_slides + 1)
+        with ThreadPoolExecutor(max_workers=min(len(slide_nums), os.cpu_count() or 1)) as executor:
+            results = executor.map(check_slide, slide_nums)
+            for row, violation in results:
+                if row is not None:
+                    slide_margin_rows.append(row)
+                if violation is not None:
+                    margin_violations.append(violation)
+
+    # The three hashes are independent reads; hashlib releases the GIL while digesting.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        source_info, html_info, pptx_info = executor.map(file_info, (md_path, html_path, pptx_path))
 
     manifest = {
         # Deterministic: keep this stable so repeated renders of the same `.md` produce identical manifests.
         "rendered_at": FIXED_RENDERED_AT,
-        "marp": {"bin": args.marp, "version": marp_version(args.marp)},
+        "marp": {"bin": args.marp, "version": marp_ver},
         "normalization": {"pptx": normalization},
-        "source": file_info(md_path).__dict__,
+        "source": source_info.__dict__,
         "checks": {
             "unreplaced_tokens": [],
             "images_checked": checked_images,
@@ -429,14 +523,14 @@ def main() -> None:
             "slide_whitespace": {
                 "analysis_size": {"width": 1280, "height": 720},
                 "min_margins_px": margin_requirements,
-                "method": {"blur_radius": 3.0, "diff_threshold": 20, "trim_percentile": 1.0},
+                "method": {"blur_radius": 3.0, "diff_threshold": 20, "trim_percentile": 1.0, "blur_backend": blur_backend},
                 "per_slide": slide_margin_rows,
                 "violations": margin_violations,
             },
         },
         "outputs": {
-            "html": file_info(html_path).__dict__,
-            "pptx": file_info(pptx_path).__dict__,
+            "html": html_info.__dict__,
+            "pptx": pptx_info.__dict__,
         },
     }
 
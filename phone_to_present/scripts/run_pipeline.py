@@ -18,30 +18,41 @@ import argparse
 import hashlib
 import json
 import math
+import os
 import re
 import subprocess
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
+from functools import cached_property, lru_cache
+from importlib import metadata
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import matplotlib
-
-matplotlib.use("Agg")
-
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
+
+from verify_financials import verify_manifest
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# matplotlib / seaborn are imported by the chart helpers on first use, so runs that stop at
+# a config or mapping gate exit without paying for them.
 
 
 ROOT = Path(__file__).resolve().parent.parent  # phone_to_present/
 TEMPLATE_PATH = ROOT / "templates" / "presentation_template.md"
 RENDER_VERIFY = ROOT / "scripts" / "render_verify.py"
-VERIFY_FINANCIALS = ROOT / "scripts" / "verify_financials.py"
 
 PLACEHOLDER_RE = re.compile(r"\{\{([A-Z0-9_]+)\}\}")
+WHITESPACE_RE = re.compile(r"\s+")
+SLUG_SEP_RE = re.compile(r"[^a-zA-Z0-9]+")
 DAY_ORDER = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+DAY_LABELS = np.asarray(DAY_ORDER, dtype=object)  # indexed by dayofweek (Mon=0)
+MC_BLOCK_ELEMENTS = 1 << 20  # Monte Carlo durations drawn per batch (bounds the sims x calls arrays)
+WEEKS_PER_MONTH = 4.33
 
 
 def read_json(path: Path) -> dict[str, Any]:
@@ -53,17 +64,19 @@ def write_json(path: Path, data: Any) -> None:
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashing loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
 def stable_seed(*parts: Any) -> int:
-    fp = "|".join(str(p) for p in parts)
-    digest = hashlib.sha256(fp.encode("utf-8")).hexdigest()
-    return int(digest[:8], 16)
+    # Not a security hash: a 4-byte BLAKE2b digest is the 32-bit seed, no hex round-trip.
+    fp = "|".join(map(str, parts)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(fp, digest_size=4).digest(), "big")
 
 
 def ensure_dir(path: Path) -> None:
@@ -71,22 +84,29 @@ def ensure_dir(path: Path) -> None:
 
 
 def normalize_col(s: str) -> str:
-    return re.sub(r"\s+", " ", s.strip().lower())
+    return WHITESPACE_RE.sub(" ", s.strip().lower())
 
 
 def normalize_key(s: Any) -> str:
-    return re.sub(r"\s+", " ", str(s).strip().lower())
+    return WHITESPACE_RE.sub(" ", str(s).strip().lower())
 
 
 def parse_iso_date(s: str) -> date:
     return date.fromisoformat(str(s).strip())
 
 
+CONFIRMED_VALUES = frozenset({"confirmed", "confirm", "true", "yes", "y", "1"})
+ASSUMED_VALUES = frozenset({"assumed", "assumption", "test"})
+
+
 def status_is_confirmed(v: Any) -> bool:
-    if isinstance(v, bool):
+    if v is None:
+        return False
+    if v.__class__ is bool:
         return v
-    s = str(v or "").strip().lower()
-    return s in {"confirmed", "confirm", "true", "yes", "y", "1"}
+    if v.__class__ is str:
+        return v.strip().lower() in CONFIRMED_VALUES
+    return str(v or "").strip().lower() in CONFIRMED_VALUES
 
 
 def status_label(v: Any, *, default: str = "Unconfirmed") -> str:
@@ -95,16 +115,20 @@ def status_label(v: Any, *, default: str = "Unconfirmed") -> str:
     s = str(v or "").strip()
     if not s:
         return default
-    if s.lower() in {"assumed", "assumption", "test"}:
+    if s.lower() in ASSUMED_VALUES:
         return "Assumed for analysis"
     return s
 
 
 def slugify(s: str) -> str:
-    cleaned = re.sub(r"[^a-zA-Z0-9]+", "-", str(s).strip().lower()).strip("-")
+    cleaned = SLUG_SEP_RE.sub("-", str(s).strip().lower()).strip("-")
     return cleaned or "default"
 
 
+def distinct_location_names(values: Any) -> list[str]:
+    return sorted({name for name in (str(v).strip() for v in values) if name})
+
+
 def load_location_overrides(cfg: dict[str, Any]) -> dict[str, dict[str, Any]]:
     raw = cfg.get("location_overrides") or {}
     if raw is None:
@@ -146,6 +170,29 @@ def fmt_pct(x: float, digits: int = 1) -> str:
     return f"{x:.{digits}f}"
 
 
+def price_option(
+    *,
+    weekly_rate: float,
+    ot_hourly: float,
+    weekend_premium: float,
+    fte_total: float,
+    hourly_fte: float,
+    ot_hours: float,
+    weekend_days: int,
+) -> dict[str, float]:
+    """Weekly base/OT/weekend split for one staffing option, scaled to monthly and annual totals."""
+    base = weekly_rate * fte_total
+    ot = ot_hourly * hourly_fte * ot_hours
+    weekend = weekend_premium * hourly_fte * weekend_days
+    weekly = base + ot + weekend
+    monthly = weekly * WEEKS_PER_MONTH
+    return {"base": base, "ot": ot, "weekend": weekend, "weekly": weekly, "monthly": monthly, "annual": monthly * 12}
+
+
+def safe_ratio(part: float, whole: float, scale: float = 1.0) -> float:
+    return part / whole * scale if whole else 0.0
+
+
 def clamp_text(s: str, max_chars: int) -> str:
     compact = " ".join(str(s).split())
     if max_chars <= 1:
@@ -155,22 +202,66 @@ def clamp_text(s: str, max_chars: int) -> str:
     return compact[: max_chars - 1].rstrip() + "…"
 
 
-def extract_placeholders(text: str) -> list[str]:
-    return sorted(set(PLACEHOLDER_RE.findall(text)))
+@lru_cache(maxsize=1)
+def _read_template(path: Path, mtime_ns: int) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def load_template(path: Path = TEMPLATE_PATH) -> str:
+    """Decoded template text, re-read only when the file changes (repeat main() calls in one process)."""
+    return _read_template(path, path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def split_template(template_text: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """(literal segments, placeholder names) in encounter order; literals has one more entry."""
+    parts = PLACEHOLDER_RE.split(template_text)
+    return tuple(parts[0::2]), tuple(parts[1::2])
 
 
 def apply_template(template_text: str, variables: dict[str, str]) -> str:
-    placeholders = extract_placeholders(template_text)
-    missing = [p for p in placeholders if p not in variables]
+    literals, names = split_template(template_text)
+    missing = sorted({n for n in names if n not in variables})
     if missing:
         raise ValueError("Missing template variables:\n" + "\n".join(f"- {m}" for m in missing))
-    out = template_text
-    for k, v in variables.items():
-        out = out.replace(f"{{{{{k}}}}}", v)
-    leftover = extract_placeholders(out)
-    if leftover:
-        raise ValueError("Unreplaced template variables remain:\n" + "\n".join(f"- {m}" for m in leftover))
-    return out
+    # Template parsed once (cached); rendering is one join, and substituted values are not rescanned.
+    out = [literals[0]]
+    for name, literal in zip(names, literals[1:]):
+        out.append(variables[name])
+        out.append(literal)
+    return "".join(out)
+
+
+def read_calls_csv(path: Path) -> pd.DataFrame:
+    """PyArrow's multithreaded CSV reader when installed (types timestamps/ints while parsing)."""
+    try:
+        return pd.read_csv(path, encoding="utf-8-sig", engine="pyarrow")
+    except (ImportError, ValueError):
+        # ValueError covers pd.errors.ParserError / pyarrow.ArrowInvalid: pyarrow rejects ragged
+        # rows that the C engine pads with NaN, so re-read those files the way it always did.
+        return pd.read_csv(path, encoding="utf-8-sig")
+
+
+def read_calls_excel(path: Path) -> pd.DataFrame:
+    """Rust calamine reader when python-calamine is installed (streams the sheet); else pandas' default."""
+    try:
+        return pd.read_excel(path, engine="calamine")
+    except ImportError:
+        return pd.read_excel(path)
+
+
+def as_utc_timestamps(s: pd.Series) -> pd.Series:
+    if isinstance(s.dtype, pd.DatetimeTZDtype):
+        return s.dt.tz_convert("UTC")
+    if pd.api.types.is_datetime64_dtype(s.dtype):
+        return s.dt.tz_localize("UTC")  # same as to_datetime(utc=True) on naive values
+    return pd.to_datetime(s, utc=True, errors="raise")
+
+
+def as_int_seconds(s: pd.Series) -> pd.Series:
+    if pd.api.types.is_integer_dtype(s.dtype) and not pd.api.types.is_extension_array_dtype(s.dtype):
+        return s.astype(int)
+    return pd.to_numeric(s, errors="raise").astype(int)
 
 
 def run_cmd(cmd: list[str], *, cwd: Path) -> None:
@@ -179,60 +270,155 @@ def run_cmd(cmd: list[str], *, cwd: Path) -> None:
         raise RuntimeError((proc.stderr or proc.stdout or "").strip() or f"Command failed: {cmd}")
 
 
-def disposition_normalize(raw: Any) -> tuple[str, float]:
+DISP_EXACT: dict[str, str] = {
+    "answered": "answered",
+    "completed": "answered",
+    "connected": "answered",
+    "missed": "missed",
+    "no answer": "missed",
+    "unanswered": "missed",
+    "abandoned": "abandoned",
+    "hang up": "abandoned",
+    "hungup": "abandoned",
+    "voicemail": "voicemail",
+    "vm": "voicemail",
+    "left message": "voicemail",
+    "forwarded": "redirected",
+    "redirected": "redirected",
+    "transferred": "redirected",
+    "transfer": "redirected",
+}
+
+DIR_EXACT: dict[str, str] = {
+    "inbound": "inbound",
+    "incoming": "inbound",
+    "in": "inbound",
+    "outbound": "outbound",
+    "outgoing": "outbound",
+    "out": "outbound",
+    "internal": "internal",
+    "transfer": "internal",
+}
+
+
+@lru_cache(maxsize=None)
+def _substring_matcher(items: tuple[tuple[str, str], ...]) -> tuple[re.Pattern[str], dict[str, int]]:
+    """
+    One regex for all mapping keys: a lookahead at every position, alternatives in dict
+    order, so findall() reports each key occurrence in a single scan (at a shared position
+    the earlier key wins, which is the one that matters). Returns (pattern, key -> rank).
+    """
+    keys = [k for k, _ in items]
+    pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in keys) + "))")
+    return pattern, {k: i for i, k in enumerate(keys)}
+
+
+def substring_lookup(s: str, mapping: dict[str, str]) -> str | None:
+    """Value of the first key (in dict order) that occurs in s, or None."""
+    pattern, rank = _substring_matcher(tuple(mapping.items()))
+    hits = pattern.findall(s)
+    if not hits:
+        return None
+    return mapping[min(hits, key=rank.__getitem__)]
+
+
+def normalize_by_mapping(raw: Any, mapping: dict[str, str]) -> tuple[str, float]:
     if raw is None:
         return "unknown", 0.0
     s = str(raw).strip().lower()
     if not s:
         return "unknown", 0.0
-    mapping = {
-        "answered": "answered",
-        "completed": "answered",
-        "connected": "answered",
-        "missed": "missed",
-        "no answer": "missed",
-        "unanswered": "missed",
-        "abandoned": "abandoned",
-        "hang up": "abandoned",
-        "hungup": "abandoned",
-        "voicemail": "voicemail",
-        "vm": "voicemail",
-        "left message": "voicemail",
-        "forwarded": "redirected",
-        "redirected": "redirected",
-        "transferred": "redirected",
-        "transfer": "redirected",
-    }
     if s in mapping:
         return mapping[s], 1.0
-    for k, v in mapping.items():
-        if k in s:
-            return v, 0.8
+    v = substring_lookup(s, mapping)
+    if v is not None:
+        return v, 0.8
     return "unknown", 0.0
 
 
+def disposition_normalize(raw: Any) -> tuple[str, float]:
+    return normalize_by_mapping(raw, DISP_EXACT)
+
+
 def direction_normalize(raw: Any) -> tuple[str, float]:
-    if raw is None:
-        return "unknown", 0.0
-    s = str(raw).strip().lower()
-    if not s:
-        return "unknown", 0.0
-    mapping = {
-        "inbound": "inbound",
-        "incoming": "inbound",
-        "in": "inbound",
-        "outbound": "outbound",
-        "outgoing": "outbound",
-        "out": "outbound",
-        "internal": "internal",
-        "transfer": "internal",
-    }
-    if s in mapping:
-        return mapping[s], 1.0
-    for k, v in mapping.items():
-        if k in s:
-            return v, 0.8
-    return "unknown", 0.0
+    return normalize_by_mapping(raw, DIR_EXACT)
+
+
+def normalize_series(values: pd.Series, mapping: dict[str, str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise `normalize_by_mapping`: exact hits via `Series.map`, then the substring
+    fallback once per distinct unmatched value (raw statuses repeat heavily).
+    Missing values (None/NaN) and blanks map to ("unknown", 0.0).
+    Returns (labels as an object array, confidences) aligned with `values`.
+    """
+    s = values.astype("string").str.strip().str.lower()
+    mapped = s.map(mapping)
+    exact = mapped.notna().to_numpy(dtype=bool)
+    norm = np.where(exact, mapped.to_numpy(dtype=object), "unknown").astype(object)
+    conf = np.where(exact, 1.0, 0.0)
+
+    pending = (~exact) & (s.notna() & (s != "")).to_numpy(dtype=bool)
+    if pending.any():
+        idx = np.flatnonzero(pending)
+        codes, uniques = pd.factorize(s.iloc[idx])
+        found = np.array([substring_lookup(u, mapping) for u in uniques], dtype=object)[codes]
+        hit = found != None  # noqa: E711 (elementwise on an object array)
+        rows = idx[hit]
+        norm[rows] = found[hit]
+        conf[rows] = 0.8
+
+    return norm, conf
+
+
+# Every label normalize_series can emit for dispositions; stored as a Categorical so
+# the metrics compare small integer codes instead of strings.
+DISPOSITION_CATEGORIES = ["answered", "missed", "abandoned", "voicemail", "redirected", "unknown"]
+DISP_CODE = {c: i for i, c in enumerate(DISPOSITION_CATEGORIES)}
+
+NORMALIZED_COLS = [
+    "location_name",
+    "start_time_utc",
+    "end_time_utc",
+    "duration_seconds",
+    "direction",
+    "direction_confidence",
+    "disposition_raw",
+    "disposition_normalized",
+    "disposition_confidence",
+]
+
+
+# Columns the open-hours metrics, charts and concurrency blocks read.
+OPEN_HOURS_COLS = [
+    "start_time_local",
+    "end_time_local",
+    "duration_seconds",
+    "day_of_week",
+    "hour_local",
+]
+
+
+def normalize_chunk(chunk: pd.DataFrame, mapping: dict[str, str | None]) -> pd.DataFrame:
+    """Coerce one block of raw rows (column names per `mapping`) into NORMALIZED_COLS."""
+    col_location = mapping["location"]
+    direction, direction_conf = normalize_series(chunk[mapping["direction"]], DIR_EXACT)
+    disposition, disposition_conf = normalize_series(chunk[mapping["status"]], DISP_EXACT)
+    # One constructor call instead of nine column inserts into an empty frame.
+    return pd.DataFrame(
+        {
+            "location_name": chunk[col_location].astype(str) if col_location else "",
+            "start_time_utc": as_utc_timestamps(chunk[mapping["start_time"]]),
+            "end_time_utc": as_utc_timestamps(chunk[mapping["end_time"]]),
+            "duration_seconds": as_int_seconds(chunk[mapping["duration"]]),
+            "direction": direction,
+            "direction_confidence": direction_conf,
+            "disposition_raw": chunk[mapping["status"]].astype(str),
+            "disposition_normalized": pd.Categorical(disposition, categories=DISPOSITION_CATEGORIES),
+            "disposition_confidence": disposition_conf,
+        },
+        index=chunk.index,
+        columns=NORMALIZED_COLS,
+    )
 
 
 def grade_from_answer_rate(answer_rate: float) -> tuple[str, str, str, str]:
@@ -252,6 +438,16 @@ class BusinessHours:
     # day -> (open_minutes, close_minutes) or None if closed
     windows: dict[str, tuple[int, int] | None]
 
+    @cached_property
+    def table(self) -> np.ndarray:
+        """(7, 2) open/close minutes per weekday (Mon=0); -1 marks a closed day."""
+        t = np.full((7, 2), -1, dtype=np.int16)
+        for i, d in enumerate(DAY_ORDER):
+            w = self.windows.get(d)
+            if w:
+                t[i] = w
+        return t
+
     def describe(self) -> str:
         weekday = [self.windows.get(d) for d in DAY_ORDER[:5]]
         if all(w == weekday[0] and w is not None for w in weekday):
@@ -323,73 +519,167 @@ def load_business_hours(cfg: dict[str, Any]) -> BusinessHours:
 
 
 def compute_open_flag(ts_local: pd.Timestamp, bh: BusinessHours, closures: set[date] | None = None) -> tuple[bool, str, int]:
-    day = ts_local.strftime("%a")[:3]
+    dow = ts_local.weekday()
+    day = DAY_ORDER[dow]
     if closures and ts_local.date() in closures:
         return False, day, ts_local.hour
-    mins = ts_local.hour * 60 + ts_local.minute
-    w = bh.windows.get(day)
-    if not w:
+    o, c = bh.table[dow]
+    if o < 0:
         return False, day, ts_local.hour
-    o, c = w
-    return (o <= mins < c), day, ts_local.hour
-
-
-def build_time_weighted_concurrency(start_s: np.ndarray, end_s: np.ndarray) -> dict[int, float]:
-    start_s = np.sort(np.asarray(start_s, dtype=float))
-    end_s = np.sort(np.asarray(end_s, dtype=float))
+    mins = ts_local.hour * 60 + ts_local.minute
+    return bool(o <= mins < c), day, ts_local.hour
+
+
+def epoch_seconds(ts: pd.Series) -> np.ndarray:
+    """Float epoch seconds of a tz-aware datetime Series, read from its int64 nanosecond buffer."""
+    ns = ts.to_numpy(dtype="datetime64[ns]").view(np.int64)  # no copy when already ns
+    return ns / 1e9
+
+
+def local_days(ts_local: pd.Series) -> np.ndarray:
+    """Local calendar day of each tz-aware timestamp as datetime64[D]."""
+    return ts_local.dt.tz_localize(None).to_numpy().astype("datetime64[D]")
+
+
+def closure_mask(ts_local: pd.Series, closures: set[date] | None) -> np.ndarray:
+    if not closures:
+        return np.zeros(len(ts_local), dtype=bool)
+    return np.isin(local_days(ts_local), np.array(sorted(closures), dtype="datetime64[D]"))
+
+
+def compute_open_flags(
+    ts_local: pd.Series, bh: BusinessHours, closures: set[date] | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Column-wise `compute_open_flag`: (is_open, dayofweek, hour) arrays for a tz-aware Series (Mon=0)."""
+    dow = ts_local.dt.dayofweek.to_numpy()
+    hour = ts_local.dt.hour.to_numpy().astype(int)
+    mins = hour * 60 + ts_local.dt.minute.to_numpy()
+
+    o = bh.table[dow, 0]
+    c = bh.table[dow, 1]
+    is_open = (o >= 0) & (o <= mins) & (mins < c)
+    if closures:
+        is_open &= ~closure_mask(ts_local, closures)
+    return is_open, dow, hour
+
+
+def sweep_levels(start_sorted: np.ndarray, end_sorted: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merge presorted start/end times into one event timeline (ends before starts on ties)
+    and return, for each gap between consecutive events, the concurrency level during it
+    and its length.
+    """
+    n = start_sorted.shape[0]
+    # Merged position of each event = own rank + number of the other kind that precede it.
+    start_pos = np.arange(n) + np.searchsorted(end_sorted, start_sorted, side="right")
+    end_pos = np.arange(n) + np.searchsorted(start_sorted, end_sorted, side="left")
+
+    times = np.empty(2 * n, dtype=float)
+    times[start_pos] = start_sorted
+    times[end_pos] = end_sorted
+    steps = np.empty(2 * n, dtype=np.int64)
+    steps[start_pos] = 1
+    steps[end_pos] = -1
+
+    return np.cumsum(steps[:-1]), np.diff(times)
+
+
+def time_weighted_histograms(
+    start_sorted: np.ndarray, end_s: np.ndarray, *, ends_sorted: bool = False
+) -> tuple[np.ndarray, int]:
+    """
+    Batched `build_time_weighted_concurrency` for a (sims, n) array of end times that share
+    one presorted start array. Returns a dense (sims, levels) array of time spent at each
+    concurrency level, plus the level stored in column 0 (0 unless some end < start).
+    Pass ends_sorted=True when every row of end_s is already sorted (skips the copy + sort).
+    """
+    k, n = end_s.shape
+    end_sorted = end_s if ends_sorted else np.sort(end_s, axis=1)
+    # Merge each row with the shared starts (ends before starts on ties): ends land at their
+    # rank plus the starts before them, and the starts fill the remaining slots in order.
+    end_pos = np.arange(n) + np.searchsorted(start_sorted, end_sorted, side="left")
+    is_end = np.zeros((k, 2 * n), dtype=bool)
+    np.put_along_axis(is_end, end_pos, True, axis=1)
+
+    times = np.empty((k, 2 * n), dtype=float)
+    times[is_end] = end_sorted.ravel()
+    times[~is_end] = np.tile(start_sorted, k)
+    levels = np.cumsum(np.where(is_end[:, :-1], -1, 1), axis=1)
+    dt = np.diff(times, axis=1)
+
+    lo = min(int(levels.min()), 0)
+    width = n + 1 - lo
+    flat = (levels - lo) + (np.arange(k) * width)[:, None]
+    # Rows sit back to back in one bincount, which adds each row/level's gaps in timeline
+    # order exactly like the sequential sweep (zero-length gaps add 0.0).
+    hist = np.bincount(flat.ravel(), weights=np.where(dt > 0, dt, 0.0).ravel(), minlength=k * width)
+    return hist.reshape(k, width), lo
+
+
+def build_time_weighted_concurrency(start_s: np.ndarray, end_s: np.ndarray, *, presorted: bool = False) -> dict[int, float]:
+    start_s = np.asarray(start_s, dtype=float)
+    end_s = np.asarray(end_s, dtype=float)
+    if not presorted:
+        start_s = np.sort(start_s)
+        end_s = np.sort(end_s)
     n = start_s.shape[0]
     if n == 0:
         return {0: 0.0}
 
-    i = 0
-    j = 0
-    level = 0
-    time_at: dict[int, float] = {}
-    last = min(start_s[0], end_s[0])
-
-    while i < n or j < n:
-        next_start = start_s[i] if i < n else math.inf
-        next_end = end_s[j] if j < n else math.inf
-
-        # End before start on ties
-        if next_end <= next_start:
-            t = next_end
-            if t > last:
-                time_at[level] = time_at.get(level, 0.0) + (t - last)
-            level -= 1
-            j += 1
-            last = t
-        else:
-            t = next_start
-            if t > last:
-                time_at[level] = time_at.get(level, 0.0) + (t - last)
-            level += 1
-            i += 1
-            last = t
+    levels, dt = sweep_levels(start_s, end_s)
+    keep = dt > 0
+    levels = levels[keep]
+    if levels.size == 0:
+        return {}
 
-    return time_at
+    # bincount adds each level's gaps in timeline order, matching a sequential sweep exactly.
+    lo = min(int(levels.min()), 0)
+    time_at = np.bincount(levels - lo, weights=dt[keep])
+    return {int(k) + lo: float(time_at[k]) for k in np.flatnonzero(time_at > 0)}
 
 
-def concurrency_at_arrival(start_s: np.ndarray, end_s: np.ndarray) -> np.ndarray:
+def concurrency_at_arrival(
+    start_s: np.ndarray,
+    end_s: np.ndarray,
+    *,
+    order: np.ndarray | None = None,
+    end_sorted: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Calls in progress at each arrival, in input order. Callers that already hold the
+    stable argsort of start_s and/or the sorted end times can pass them to skip those sorts.
+    """
     start_s = np.asarray(start_s, dtype=float)
-    end_s = np.asarray(end_s, dtype=float)
-    order = np.argsort(start_s, kind="mergesort")
+    if order is None:
+        order = np.argsort(start_s, kind="mergesort")
     start_sorted = start_s[order]
-    end_sorted = np.sort(end_s)
+    if end_sorted is None:
+        end_sorted = np.sort(np.asarray(end_s, dtype=float))
 
-    conc_sorted = np.zeros_like(start_sorted, dtype=int)
-    j = 0
-    for i, st in enumerate(start_sorted):
-        while j < len(end_sorted) and end_sorted[j] <= st:
-            j += 1
-        conc_sorted[i] = (i - j) + 1
+    # Arrival i sees (i + 1) starts so far minus the calls that already ended (end <= start).
+    # Stable argsort keeps tied arrivals in input order, so the scatter below is deterministic.
+    j = np.searchsorted(end_sorted, start_sorted, side="right")
+    conc_sorted = np.arange(1, start_sorted.shape[0] + 1, dtype=int) - j
 
     out = np.zeros_like(conc_sorted)
     out[order] = conc_sorted
     return out
 
 
-def calculate_base_fte(time_weighted: dict[int, float], target_coverage: float) -> int:
+def calculate_base_fte(time_weighted: dict[int, float] | np.ndarray, target_coverage: float) -> int:
+    if isinstance(time_weighted, np.ndarray):
+        # Dense histogram indexed by level (column 0 = level 0).
+        pos = np.asarray(time_weighted[1:], dtype=float)
+        present = pos > 0
+        if not present.any():
+            return 1
+        cum = np.cumsum(pos)
+        total = cum[-1]
+        if total <= 0:
+            return 1
+        hit = np.flatnonzero((cum / total >= target_coverage) & present)
+        return int(hit[0] if hit.size else np.flatnonzero(present)[-1]) + 1
+
     levels = sorted([k for k in time_weighted.keys() if k > 0])
     if not levels:
         return 1
@@ -559,26 +849,63 @@ def run_monte_carlo_fte(
     if used_model == "exponential" and aht_lambda is None:
         raise ValueError("aht_lambda is required when duration_model is exponential (or when bootstrap falls back).")
 
-    fte: list[int] = []
-    for _ in range(int(num_sims)):
-        if used_model == "exponential":
-            u = rng.random(start_s_sorted.shape[0])
-            u = np.clip(u, 1e-12, 1 - 1e-12)
-            durations = (-np.log(u) / float(aht_lambda)).astype(float)
-        else:
-            assert pool is not None
-            durations = rng.choice(pool, size=start_s_sorted.shape[0], replace=True).astype(float)
-
-        if duration_cap_s is not None:
-            durations = np.minimum(durations, float(duration_cap_s))
-        durations = np.maximum(durations, float(duration_floor_s))
-
-        end_s = start_s_sorted + durations
-        tw = build_time_weighted_concurrency(start_s_sorted, end_s)
-        fte.append(calculate_base_fte(tw, target_coverage))
+    n = start_s_sorted.shape[0]
+    # With no arrivals every sim sweeps an empty timeline, which calculate_base_fte maps to 1.
+    fte: list[int] = [] if n else [1] * int(num_sims)
+
+    def sweep_block(ends: np.ndarray) -> list[int]:
+        ends.sort(axis=1)
+        hist, lo = time_weighted_histograms(start_s_sorted, ends, ends_sorted=True)
+        return [calculate_base_fte(row, target_coverage) for row in hist[:, -lo:]]
+
+    # Draw and sweep sims in blocks. Generator draws for a (k, n) block consume the stream
+    # exactly like k successive size-n draws, so results match a per-sim loop. Draws stay
+    # sequential on this thread; the sweeps (sort/searchsorted/bincount release the GIL) run
+    # on a small pool, at most `workers` blocks in flight, collected in submission order.
+    total = int(num_sims) if n else 0
+    workers = max(1, min(os.cpu_count() or 1, total))
+    block = max(1, min(MC_BLOCK_ELEMENTS // max(n, 1), -(-total // workers)))
+    free: list[np.ndarray] = []  # (block, n) buffers whose sweep has finished
+    in_flight: deque[tuple[Future[list[int]], np.ndarray]] = deque()
+
+    def collect_oldest() -> None:
+        done, buf = in_flight.popleft()
+        fte.extend(done.result())
+        free.append(buf)
+
+    remaining = total
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while remaining > 0:
+            k = min(block, remaining)
+            remaining -= k
+            if len(in_flight) >= workers:
+                collect_oldest()
+            buf = free.pop() if free else np.empty((min(block, total), n), dtype=float)
+            # u -> durations -> end times, in place.
+            durations = buf[:k]
+            if used_model == "exponential":
+                rng.random(out=durations)
+                np.clip(durations, 1e-12, 1 - 1e-12, out=durations)
+                np.log(durations, out=durations)
+                np.negative(durations, out=durations)
+                np.divide(durations, float(aht_lambda), out=durations)
+            else:
+                assert pool is not None
+                durations[...] = rng.choice(pool, size=(k, n), replace=True)
 
-    arr = np.asarray(fte, dtype=float)
-    counts = {str(int(k)): int(v) for k, v in pd.Series(fte).value_counts().sort_index().items()}
+            if duration_cap_s is not None:
+                np.minimum(durations, float(duration_cap_s), out=durations)
+            np.maximum(durations, float(duration_floor_s), out=durations)
+
+            np.add(start_s_sorted, durations, out=durations)
+            in_flight.append((executor.submit(sweep_block, durations), buf))
+        while in_flight:
+            collect_oldest()
+
+    fte_i = np.asarray(fte, dtype=np.int64)
+    arr = fte_i.astype(float)
+    bc = np.bincount(fte_i)  # FTE levels are small non-negative ints
+    counts = {str(int(k)): int(bc[k]) for k in np.flatnonzero(bc)}
     return {
         "seed": int(seed),
         "num_simulations": int(num_sims),
@@ -595,8 +922,72 @@ def run_monte_carlo_fte(
     }
 
 
+@lru_cache(maxsize=None)
+def _load_matplotlib() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def new_chart_figure(size: tuple[float, float]) -> tuple[Figure, Any]:
+    """
+    Fresh (fig, ax) for one chart. Charts render concurrently on pool threads, so each
+    gets its own Figure (OO API, no pyplot state) that is dropped once it is saved.
+    """
+    _load_matplotlib()
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=size, dpi=150)
+    return fig, fig.add_subplot()
+
+
+@lru_cache(maxsize=None)
+def _chart_code_digest() -> bytes:
+    # Any edit to this script (chart code, styling) or a matplotlib/seaborn upgrade (rendering)
+    # invalidates previously rendered charts. Versions come from package metadata, so a run
+    # whose charts are all current still never imports matplotlib.
+    h = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    for dist in ("matplotlib", "seaborn"):
+        try:
+            version = metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            version = ""
+        h.update(f"\0{dist}={version}".encode("utf-8"))
+    return h.digest()
+
+
+def chart_input_key(make: Any, args: tuple[Any, ...]) -> str:
+    """Content hash of a chart function's inputs; the PNG is a deterministic function of it."""
+    h = hashlib.blake2b(_chart_code_digest(), digest_size=16)
+    h.update(make.__name__.encode("utf-8"))
+    for arg in args:
+        if isinstance(arg, pd.DataFrame):
+            h.update(repr((list(arg.columns), list(arg.index))).encode("utf-8"))
+            h.update(pd.util.hash_pandas_object(arg, index=False).to_numpy().tobytes())
+        else:
+            h.update(repr(arg).encode("utf-8"))
+    return h.hexdigest()
+
+
+def chart_is_current(path: Path, key: str) -> bool:
+    # Sidecar records "<input key> <png sha256>", so a PNG edited or truncated on disk is redrawn.
+    key_path = path.with_name(path.name + ".hash")
+    try:
+        cached = key_path.read_text(encoding="utf-8").split()
+        return cached[:1] == [key] and cached[1:] == [sha256_file(path)]
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def render_chart(make: Any, path: Path, *args: Any, key: str) -> None:
+    make(path, *args)
+    path.with_name(path.name + ".hash").write_text(f"{key} {sha256_file(path)}\n", encoding="utf-8")
+
+
 def make_answer_rate_gauge(path: Path, answer_rate: float, grade: str) -> None:
-    fig, ax = plt.subplots(figsize=(6.7, 4.6), dpi=150)
+    from matplotlib.patches import Circle, Wedge
+
+    fig, ax = new_chart_figure((6.7, 4.6))
     ax.axis("off")
 
     zones = [
@@ -609,12 +1000,12 @@ def make_answer_rate_gauge(path: Path, answer_rate: float, grade: str) -> None:
     for a, b, color in zones:
         theta1 = 180 * (1 - b / 100)
         theta2 = 180 * (1 - a / 100)
-        wedge = matplotlib.patches.Wedge((0, 0), 1.0, theta1, theta2, width=0.25, facecolor=color, edgecolor="white")
+        wedge = Wedge((0, 0), 1.0, theta1, theta2, width=0.25, facecolor=color, edgecolor="white")
         ax.add_patch(wedge)
 
     angle = math.radians(180 * (1 - answer_rate / 100))
     ax.plot([0, 0.85 * math.cos(angle)], [0, 0.85 * math.sin(angle)], color="#27343C", linewidth=3)
-    ax.add_patch(matplotlib.patches.Circle((0, 0), 0.05, color="#27343C"))
+    ax.add_patch(Circle((0, 0), 0.05, color="#27343C"))
     ax.text(0, -0.25, f"{answer_rate:.1f}%", ha="center", va="center", fontsize=20, fontweight="bold", color="#27343C")
     ax.text(0, -0.38, f"Grade: {grade}", ha="center", va="center", fontsize=14, color="#27343C")
     ax.text(0, 0.95, "Answer Rate Performance", ha="center", va="center", fontsize=14, fontweight="bold")
@@ -623,11 +1014,10 @@ def make_answer_rate_gauge(path: Path, answer_rate: float, grade: str) -> None:
     ax.set_ylim(-0.5, 1.1)
     fig.tight_layout()
     fig.savefig(path, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
 
 
 def make_process_capacity_pie(path: Path, process_pct: float, capacity_pct: float) -> None:
-    fig, ax = plt.subplots(figsize=(5.2, 5.2), dpi=150)
+    fig, ax = new_chart_figure((5.2, 5.2))
     labels = ["Process", "Capacity"]
     sizes = [max(process_pct, 0.0), max(capacity_pct, 0.0)]
     colors = ["#E63946", "#EAB308"]
@@ -635,11 +1025,12 @@ def make_process_capacity_pie(path: Path, process_pct: float, capacity_pct: floa
     ax.set_title("Why Calls Are Missed (Open Hours)", fontsize=14, fontweight="bold")
     fig.tight_layout()
     fig.savefig(path, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
 
 
 def make_heatmap(path: Path, miss_rate_matrix: pd.DataFrame) -> None:
-    fig, ax = plt.subplots(figsize=(8.0, 5.0), dpi=150)
+    fig, ax = new_chart_figure((8.0, 5.0))
+    import seaborn as sns  # after new_chart_figure: seaborn pulls in pyplot, which must see the Agg backend
+
     sns.heatmap(
         miss_rate_matrix,
         ax=ax,
@@ -655,11 +1046,10 @@ def make_heatmap(path: Path, miss_rate_matrix: pd.DataFrame) -> None:
     ax.set_ylabel("Hour (Local)")
     fig.tight_layout()
     fig.savefig(path, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
 
 
 def make_hourly_volume(path: Path, hourly: pd.DataFrame) -> None:
-    fig, ax = plt.subplots(figsize=(10.0, 4.8), dpi=150)
+    fig, ax = new_chart_figure((10.0, 4.8))
     ax.bar(hourly.index, hourly["answered"], label="Answered", color="#10B981")
     ax.bar(hourly.index, hourly["missed"], bottom=hourly["answered"], label="Missed", color="#E63946")
     ax.set_title("Hourly Call Distribution (Open Hours)", fontsize=14, fontweight="bold")
@@ -668,11 +1058,10 @@ def make_hourly_volume(path: Path, hourly: pd.DataFrame) -> None:
     ax.legend()
     fig.tight_layout()
     fig.savefig(path, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
 
 
 def make_daily_pattern(path: Path, daily: pd.DataFrame) -> None:
-    fig, ax1 = plt.subplots(figsize=(10.0, 4.8), dpi=150)
+    fig, ax1 = new_chart_figure((10.0, 4.8))
     ax1.bar(daily.index, daily["total"], color="#006064", label="Total Calls")
     ax1.set_ylabel("Calls")
     ax1.set_title("Daily Call Pattern (Open Hours)", fontsize=14, fontweight="bold")
@@ -685,7 +1074,6 @@ def make_daily_pattern(path: Path, daily: pd.DataFrame) -> None:
     ax2.legend(loc="upper right")
     fig.tight_layout()
     fig.savefig(path, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
 
 
 def make_fte_coverage(path: Path, time_weighted: dict[int, float], base_fte: int, target_coverage: float) -> None:
@@ -694,7 +1082,7 @@ def make_fte_coverage(path: Path, time_weighted: dict[int, float], base_fte: int
     total = values.sum()
     pct = values / total * 100 if total > 0 else values
 
-    fig, ax1 = plt.subplots(figsize=(7.2, 4.6), dpi=150)
+    fig, ax1 = new_chart_figure((7.2, 4.6))
     ax1.bar(levels, pct, color="#6B7280")
     ax1.set_xlabel("Concurrency Level")
     ax1.set_ylabel("% of Time")
@@ -714,21 +1102,23 @@ def make_fte_coverage(path: Path, time_weighted: dict[int, float], base_fte: int
 
     fig.tight_layout()
     fig.savefig(path, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
 
 
 def count_weekdays(start: date, end: date) -> int:
-    # inclusive
-    n = 0
-    for d in pd.date_range(start, end):
-        if d.strftime("%a")[:3] in DAY_ORDER[:5]:
-            n += 1
-    return n
+    # inclusive; busday_count's default weekmask is Mon-Fri and it counts without materializing the days
+    if end < start:
+        return 0
+    return int(np.busday_count(start, end + timedelta(days=1)))
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run phone_to_present pipeline and render Marp outputs.")
-    parser.add_argument("--input", required=True, type=Path, help="Path to input CSV/XLSX file.")
+    parser.add_argument(
+        "--input",
+        required=True,
+        type=Path,
+        help="Path to input CSV/XLSX file. Optional readers: pyarrow (CSV) and python-calamine (XLSX) load faster when installed.",
+    )
     parser.add_argument("--config", required=True, type=Path, help="Path to config JSON (timezone, hours, assumptions).")
     parser.add_argument("--out", required=True, type=Path, help="Output directory.")
     parser.add_argument(
@@ -746,6 +1136,14 @@ def main() -> None:
         default=None,
         help="Optional location_name filter (exact match, case-insensitive). Useful for multi-location exports.",
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Read CSV input in blocks of this many rows (e.g. 250000) to bound peak memory on very large exports.",
+    )
+    # Set by a by_location parent for its children so the input is hashed once per run.
+    parser.add_argument("--input-sha256", default=None, help=argparse.SUPPRESS)
     args = parser.parse_args()
 
     input_path: Path = args.input
@@ -796,20 +1194,26 @@ def main() -> None:
     ensure_dir(charts_dir)
 
     # Load data
-    if input_path.suffix.lower() == ".csv":
-        raw = pd.read_csv(input_path, encoding="utf-8-sig")
-    elif input_path.suffix.lower() in {".xlsx", ".xls"}:
-        raw = pd.read_excel(input_path)
+    suffix = input_path.suffix.lower()
+    if suffix == ".csv" and args.chunksize:
+        header = pd.read_csv(input_path, encoding="utf-8-sig", nrows=0)
+        chunks: Any = pd.read_csv(input_path, encoding="utf-8-sig", engine="c", chunksize=int(args.chunksize))
+    elif suffix == ".csv":
+        header = read_calls_csv(input_path)
+        chunks = [header]
+    elif suffix in {".xlsx", ".xls"}:
+        header = read_calls_excel(input_path)
+        chunks = [header]
     else:
         raise SystemExit(f"Unsupported input format: {input_path.suffix}")
 
     # Column mapping (heuristics; this is one of the things to red-team)
-    col_location = find_column(raw, ["location_name", "location", "office", "site", "branch"])
-    col_start = find_column(raw, ["call_start_time (UTC)", "call_start_time", "start_time", "start", "timestamp"])
-    col_end = find_column(raw, ["call_end_time (UTC)", "call_end_time", "end_time", "end"])
-    col_dur = find_column(raw, ["duration_secs", "duration_seconds", "duration", "talk_time", "seconds"])
-    col_dir = find_column(raw, ["call_direction", "direction", "call_type", "type"])
-    col_status = find_column(raw, ["call_status", "disposition", "status", "result", "outcome"])
+    col_location = find_column(header, ["location_name", "location", "office", "site", "branch"])
+    col_start = find_column(header, ["call_start_time (UTC)", "call_start_time", "start_time", "start", "timestamp"])
+    col_end = find_column(header, ["call_end_time (UTC)", "call_end_time", "end_time", "end"])
+    col_dur = find_column(header, ["duration_secs", "duration_seconds", "duration", "talk_time", "seconds"])
+    col_dir = find_column(header, ["call_direction", "direction", "call_type", "type"])
+    col_status = find_column(header, ["call_status", "disposition", "status", "result", "outcome"])
 
     required = {
         "start_time_utc": col_start,
@@ -822,21 +1226,18 @@ def main() -> None:
     if missing:
         raise SystemExit(f"Missing required columns (mapping failed): {missing}")
 
-    df = raw.copy()
-    df["start_time_utc"] = pd.to_datetime(df[col_start], utc=True, errors="raise")  # type: ignore[arg-type]
-    df["end_time_utc"] = pd.to_datetime(df[col_end], utc=True, errors="raise")  # type: ignore[arg-type]
-    df["duration_seconds"] = pd.to_numeric(df[col_dur], errors="raise").astype(int)  # type: ignore[arg-type]
-    df["location_name"] = df[col_location].astype(str) if col_location else ""  # type: ignore[index]
-
-    # Normalize direction + disposition
-    dir_norm = df[col_dir].apply(direction_normalize)  # type: ignore[index]
-    df["direction"] = dir_norm.apply(lambda x: x[0])
-    df["direction_confidence"] = dir_norm.apply(lambda x: float(x[1]))
-
-    disp_norm = df[col_status].apply(disposition_normalize)  # type: ignore[index]
-    df["disposition_normalized"] = disp_norm.apply(lambda x: x[0])
-    df["disposition_confidence"] = disp_norm.apply(lambda x: float(x[1]))
-    df["disposition_raw"] = df[col_status].astype(str)  # type: ignore[index]
+    column_mapping = {
+        "location": col_location,
+        "start_time": col_start,
+        "end_time": col_end,
+        "duration": col_dur,
+        "direction": col_dir,
+        "status": col_status,
+    }
+    # Only the normalized columns are kept, so each chunk's raw columns can be dropped as we go.
+    frames = [normalize_chunk(chunk, column_mapping) for chunk in chunks]
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True, copy=False)
+    del header, chunks, frames
 
     # ------------------------------------------------------------------
     # Mapping confidence gates (deterministic checks before analysis)
@@ -890,54 +1291,70 @@ def main() -> None:
     location_overrides = load_location_overrides(cfg)
     location_mode = str(analysis_cfg.get("location_mode") or "single").strip().lower()
 
-    location_values = sorted(
-        set(str(x).strip() for x in df["location_name"].dropna().unique() if str(x).strip())
-    )
+    distinct_locations = df["location_name"].dropna().unique()
+    location_values = distinct_location_names(distinct_locations)
 
     if args.location:
         wanted = normalize_key(args.location)
-        mask = df["location_name"].apply(normalize_key) == wanted
+        # normalize_key once per distinct location, then one vectorized isin over the rows.
+        matching = [v for v in distinct_locations if normalize_key(v) == wanted]
+        mask = df["location_name"].isin(matching)
         if not bool(mask.any()):
             avail = ", ".join(location_values) if location_values else "(none)"
             raise SystemExit(f"No rows matched --location={args.location!r}. Available location_name values: {avail}")
         df = df[mask].copy()
-        location_values = sorted(
-            set(str(x).strip() for x in df["location_name"].dropna().unique() if str(x).strip())
-        )
+        location_values = distinct_location_names(matching)
 
     if location_mode == "by_location" and not args.location and len(location_values) > 1:
         locations_dir = out_dir / "locations"
         ensure_dir(locations_dir)
 
+        input_sha256 = args.input_sha256 or sha256_file(input_path)
         rollup: dict[str, Any] = {
             "mode": "by_location",
-            "input": {"path": str(input_path), "sha256": sha256_file(input_path)},
+            "input": {"path": str(input_path), "sha256": input_sha256},
             "locations": [],
         }
 
-        script_path = (ROOT / "scripts" / "run_pipeline.py").resolve()
+        # Children run with cwd=ROOT, so their paths must be absolute; .absolute() needs no
+        # symlink walk, and ROOT is resolved already.
+        script_path = ROOT / "scripts" / "run_pipeline.py"
+        input_arg = str(input_path.absolute())
+        config_arg = str(args.config.absolute())
+        location_runs: list[tuple[str, Path, list[str]]] = []
         for loc in location_values:
             slug = slugify(loc)
-            sub_out = (locations_dir / slug).resolve()
+            sub_out = (locations_dir / slug).absolute()
             ensure_dir(sub_out)
 
             cmd = [
                 "python",
                 str(script_path),
                 "--input",
-                str(input_path.resolve()),
+                input_arg,
                 "--config",
-                str(args.config.resolve()),
+                config_arg,
                 "--out",
                 str(sub_out),
                 "--location",
                 loc,
+                "--input-sha256",
+                input_sha256,
             ]
             if args.allow_unconfirmed:
                 cmd.append("--allow-unconfirmed")
-
-            run_cmd(cmd, cwd=ROOT)
-
+            if args.chunksize:
+                cmd.extend(["--chunksize", str(args.chunksize)])
+            location_runs.append((loc, sub_out, cmd))
+
+        # Each location is an independent child process; threads only wait on them.
+        # Results are read in location order, so the first failing location raises first.
+        with ThreadPoolExecutor(max_workers=min(len(location_runs), os.cpu_count() or 1)) as executor:
+            children = [executor.submit(run_cmd, cmd, cwd=ROOT) for _, _, cmd in location_runs]
+            for child in children:
+                child.result()
+
+        for loc, sub_out, _ in location_runs:
             manifest_path = sub_out / "analysis_manifest.json"
             entry: dict[str, Any] = {"location_name": loc, "out_dir": str(sub_out), "manifest": str(manifest_path)}
             if manifest_path.exists():
@@ -984,7 +1401,8 @@ def main() -> None:
             except Exception as e:
                 raise SystemExit(f"Invalid per-location closure date '{item}'. Expected YYYY-MM-DD. ({e})")
     closure_set = set(closure_candidates)
-    closure_desc = "None" if not closure_set else ", ".join(sorted(d.isoformat() for d in closure_set))
+    closure_days = [d.isoformat() for d in sorted(closure_set)]  # sorted as dates, formatted once
+    closure_desc = ", ".join(closure_days) or "None"
     closure_rationale = (
         status_label(confirmations.get("closures"), default=global_closure_rationale)
         if closure_set
@@ -1009,13 +1427,10 @@ def main() -> None:
     df["start_time_local"] = df["start_time_utc"].dt.tz_convert(tz)
     df["end_time_local"] = df["end_time_utc"].dt.tz_convert(tz)
 
-    open_flags = df["start_time_local"].apply(lambda ts: compute_open_flag(ts, bh, closure_set))
-    df["is_open_hours"] = open_flags.apply(lambda x: bool(x[0]))
-    df["day_of_week"] = open_flags.apply(lambda x: x[1])
-    df["hour_local"] = open_flags.apply(lambda x: int(x[2]))
-
-    df["is_closure_day"] = df["start_time_local"].apply(lambda ts: ts.date() in closure_set)
-    df["is_weekend"] = df["day_of_week"].isin(["Sat", "Sun"])
+    df["is_open_hours"], dow, df["hour_local"] = compute_open_flags(df["start_time_local"], bh, closure_set)
+    df["day_of_week"] = DAY_LABELS[dow]
+    df["is_closure_day"] = closure_mask(df["start_time_local"], closure_set)
+    df["is_weekend"] = dow >= 5
     df["is_after_hours"] = (~df["is_open_hours"]) & (~df["is_weekend"]) & (~df["is_closure_day"])
     df["is_lunch_window"] = False
 
@@ -1040,30 +1455,48 @@ def main() -> None:
         "hour_local",
     ]
     gold_path = out_dir / "gold_calls.csv"
-    df[gold_cols].to_csv(gold_path, index=False)
+    # pandas' writer keeps the audit format (local UTC offsets, True/False); columns= avoids
+    # materializing a projected copy of the frame first.
+    df.to_csv(gold_path, columns=gold_cols, index=False)
 
     # ------------------------------------------------------------------
     # Metrics (open-hours primary)
     # ------------------------------------------------------------------
     total_records = int(len(df))
-    inbound_df = df[df["direction"] == "inbound"].copy()
-    outbound_df = df[df["direction"] == "outbound"].copy()
-    total_inbound = int(len(inbound_df))
-    total_outbound = int(len(outbound_df))
-
-    min_local = df["start_time_local"].min()
-    max_local = df["start_time_local"].max()
+    # Row masks instead of full-width copies; only the open-hours block is materialized,
+    # and only with the columns it reads.
+    inbound_mask = (df["direction"] == "inbound").to_numpy(dtype=bool)
+    open_mask = df["is_open_hours"].to_numpy(dtype=bool)
+    disp_codes = df["disposition_normalized"].cat.codes.to_numpy()
+    answered_rows = disp_codes == DISP_CODE["answered"]
+    missed_rows = (disp_codes == DISP_CODE["missed"]) | (disp_codes == DISP_CODE["abandoned"])
+    total_inbound = int(inbound_mask.sum())
+    total_outbound = int((df["direction"] == "outbound").sum())
+    # Per-disposition counts in one bincount pass over the codes of each row subset.
+    inbound_disp = np.bincount(disp_codes[inbound_mask], minlength=len(DISPOSITION_CATEGORIES))
+    inbound_answered = int(inbound_disp[DISP_CODE["answered"]])
+    inbound_missed = int(inbound_disp[DISP_CODE["missed"]] + inbound_disp[DISP_CODE["abandoned"]])
+
+    # Both reductions run straight on the int64 ns buffer (no Series/NaT handling per call).
+    local_ns = df["start_time_local"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    local_tz = df["start_time_local"].dt.tz
+    min_local = pd.Timestamp(int(local_ns.min()), tz="UTC").tz_convert(local_tz)
+    max_local = pd.Timestamp(int(local_ns.max()), tz="UTC").tz_convert(local_tz)
     min_date = min_local.date()
     max_date = max_local.date()
     days_analyzed = int((max_date - min_date).days) + 1
     weeks_in_range = days_analyzed / 7.0
 
-    open_hours_df = inbound_df[inbound_df["is_open_hours"]].copy()
-    closed_hours_df = inbound_df[~inbound_df["is_open_hours"]].copy()
+    open_rows = np.flatnonzero(inbound_mask & open_mask)
+    open_hours_df = pd.DataFrame({c: df[c].take(open_rows) for c in OPEN_HOURS_COLS})
+    open_hours_df["is_missed"] = missed_rows[open_rows]
+    open_hours_df["is_answered"] = answered_rows[open_rows]
+    closed_inbound = int(total_inbound - open_rows.size)
 
-    open_answered = int((open_hours_df["disposition_normalized"] == "answered").sum())
-    open_missed = int(open_hours_df["disposition_normalized"].isin(["missed", "abandoned"]).sum())
-    open_unknown = int((open_hours_df["disposition_normalized"] == "unknown").sum())
+    open_disp = np.bincount(disp_codes[open_rows], minlength=len(DISPOSITION_CATEGORIES))
+    open_answered = int(open_disp[DISP_CODE["answered"]])
+    open_missed = int(open_disp[DISP_CODE["missed"]] + open_disp[DISP_CODE["abandoned"]])
+    open_unknown = int(open_disp[DISP_CODE["unknown"]])
     open_known = int(len(open_hours_df) - open_unknown)
 
     answer_rate = (open_answered / open_known * 100.0) if open_known > 0 else 0.0
@@ -1083,38 +1516,52 @@ def main() -> None:
     hour_start = int(hour_start)
     hour_end = int(hour_end)
 
-    open_hours_df["is_missed"] = open_hours_df["disposition_normalized"].isin(["missed", "abandoned"])
-    total_matrix = open_hours_df.pivot_table(index="hour_local", columns="day_of_week", values="is_missed", aggfunc="size", fill_value=0)
-    missed_matrix = open_hours_df[open_hours_df["is_missed"]].pivot_table(index="hour_local", columns="day_of_week", values="is_missed", aggfunc="size", fill_value=0)
+    # One groupby gives both counts per (hour, day); missed cells absent before now read 0.
+    cells = open_hours_df.groupby(["hour_local", "day_of_week"])["is_missed"].agg(total="size", missed="sum")
+    total_matrix = cells["total"].unstack("day_of_week", fill_value=0)
+    missed_matrix = cells["missed"].unstack("day_of_week", fill_value=0)
     miss_rate_matrix = (missed_matrix / total_matrix * 100.0).fillna(0.0)
 
     existing_days = [d for d in DAY_ORDER if d in miss_rate_matrix.columns]
     miss_rate_matrix = miss_rate_matrix[existing_days]
     miss_rate_matrix = miss_rate_matrix.loc[miss_rate_matrix.index.isin(range(hour_start, hour_end))]
 
-    worst: list[dict[str, Any]] = []
-    for hour in miss_rate_matrix.index:
-        for day in miss_rate_matrix.columns:
-            total = int(total_matrix.loc[hour, day]) if (hour in total_matrix.index and day in total_matrix.columns) else 0
-            missed = int(missed_matrix.loc[hour, day]) if (hour in missed_matrix.index and day in missed_matrix.columns) else 0
-            rate = float(miss_rate_matrix.loc[hour, day])
-            if total >= min_calls_for_worst and missed > 0:
-                worst.append({"day": day, "hour": int(hour), "rate": rate, "missed": missed, "total": total})
+    # Whole-matrix filter; nonzero() yields cells row-major, i.e. in the old hour/day loop order.
+    cell_total = total_matrix.reindex_like(miss_rate_matrix).fillna(0).to_numpy(dtype=np.int64)
+    cell_missed = missed_matrix.reindex_like(miss_rate_matrix).fillna(0).to_numpy(dtype=np.int64)
+    cell_rate = miss_rate_matrix.to_numpy(dtype=float)
+    rows, cols = np.nonzero((cell_total >= min_calls_for_worst) & (cell_missed > 0))
+    worst: list[dict[str, Any]] = [
+        {
+            "day": miss_rate_matrix.columns[c],
+            "hour": int(miss_rate_matrix.index[r]),
+            "rate": float(cell_rate[r, c]),
+            "missed": int(cell_missed[r, c]),
+            "total": int(cell_total[r, c]),
+        }
+        for r, c in zip(rows.tolist(), cols.tolist())
+    ]
     worst.sort(key=lambda x: (x["rate"], x["missed"], x["total"]), reverse=True)
 
-    def worst_label(item: dict[str, Any]) -> str:
-        h = int(item["hour"])
-        return f"{item['day']} {h}:00-{h+1}:00"
-
-    worst_1 = worst[0] if len(worst) > 0 else None
-    worst_2 = worst[1] if len(worst) > 1 else None
-    worst_3 = worst[2] if len(worst) > 2 else None
+    # Deck strings for the top three windows; placeholders when fewer cells qualify.
+    worst_vars: dict[str, str] = {}
+    for rank in range(3):
+        key = f"WORST_HOUR_{rank + 1}"
+        if rank < len(worst):
+            item = worst[rank]
+            h = item["hour"]
+            worst_vars[key] = f"{item['day']} {h}:00-{h+1}:00"
+            worst_vars[f"{key}_RATE"] = fmt_pct(item["rate"], 0)
+            worst_vars[f"{key}_COUNT"] = fmt_int(item["missed"])
+        else:
+            worst_vars.update({key: "N/A", f"{key}_RATE": "0", f"{key}_COUNT": "0"})
 
     # Daily pattern (open hours)
+    # Builtin size/sum over the precomputed flags stays on pandas' Cython groupby kernels.
     daily = open_hours_df.groupby("day_of_week").agg(
-        total=("disposition_normalized", "size"),
-        answered=("disposition_normalized", lambda s: int((s == "answered").sum())),
-        missed=("disposition_normalized", lambda s: int(s.isin(["missed", "abandoned"]).sum())),
+        total=("is_missed", "size"),
+        answered=("is_answered", "sum"),
+        missed=("is_missed", "sum"),
     )
     daily["miss_rate"] = (daily["missed"] / daily["total"] * 100.0).fillna(0.0)
     daily = daily.reindex([d for d in DAY_ORDER if d in daily.index])
@@ -1122,8 +1569,8 @@ def main() -> None:
 
     # Hourly distribution (open hours)
     hourly = open_hours_df.groupby("hour_local").agg(
-        answered=("disposition_normalized", lambda s: int((s == "answered").sum())),
-        missed=("disposition_normalized", lambda s: int(s.isin(["missed", "abandoned"]).sum())),
+        answered=("is_answered", "sum"),
+        missed=("is_missed", "sum"),
     )
     hourly["total"] = hourly["answered"] + hourly["missed"]
     hourly = hourly.sort_index()
@@ -1131,11 +1578,14 @@ def main() -> None:
     # ------------------------------------------------------------------
     # Concurrency + FTE (open-hours inbound only)
     # ------------------------------------------------------------------
-    start_epoch = (open_hours_df["start_time_local"].astype("int64") / 1e9).to_numpy(dtype=float)
-    end_epoch = (open_hours_df["end_time_local"].astype("int64") / 1e9).to_numpy(dtype=float)
-    start_sorted = np.sort(start_epoch)
-
-    time_weighted = build_time_weighted_concurrency(start_epoch, end_epoch)
+    start_epoch = epoch_seconds(open_hours_df["start_time_local"])
+    end_epoch = epoch_seconds(open_hours_df["end_time_local"])
+    # Sort once: the stable arrival order and sorted ends feed both concurrency views and the MC.
+    arrival_order = np.argsort(start_epoch, kind="mergesort")
+    start_sorted = start_epoch[arrival_order]
+    end_sorted = np.sort(end_epoch)
+
+    time_weighted = build_time_weighted_concurrency(start_sorted, end_sorted, presorted=True)
     target_coverage = float(analysis_cfg.get("target_coverage", 0.90))
     base_fte = max(calculate_base_fte(time_weighted, target_coverage), 1)
 
@@ -1146,10 +1596,10 @@ def main() -> None:
     # Triggered concurrency (arrivals)
     # NOTE: Some exports contain 0-second calls (end == start). For "arrivals" analysis,
     # treat every arrival as at least 1 line ringing to avoid confusing 0-concurrency rows.
-    conc_arr = concurrency_at_arrival(start_epoch, end_epoch)
+    conc_arr = concurrency_at_arrival(start_epoch, end_epoch, order=arrival_order, end_sorted=end_sorted)
     conc_arr = np.maximum(conc_arr, 1)
-    open_hours_df["concurrency_at_arrival"] = conc_arr
-    conc_counts = pd.Series(conc_arr).value_counts().sort_index()
+    # Dense per-level histogram (levels are small non-negative ints); zero bins read like absent ones.
+    conc_counts = pd.Series(np.bincount(conc_arr))
     total_arrivals = int(conc_counts.sum())
 
     staffing_ladder = build_staffing_ladder(conc_counts, shrink_factor=shrink_factor)
@@ -1198,31 +1648,29 @@ def main() -> None:
 
     pilot_answer_rate = float(answer_rate_by_level.get(int(pilot_level), 0.0)) if staffing_ladder else 0.0
 
-    conc_0 = int(conc_counts.get(0, 0))
-    conc_1 = int(conc_counts.get(1, 0))
-    conc_2 = int(conc_counts.get(2, 0))
-    conc_3 = int(conc_counts.get(3, 0))
-    conc_4plus = int(conc_counts[conc_counts.index >= 4].sum())
+    conc_hist = conc_counts.to_numpy()
+    conc_0, conc_1, conc_2, conc_3 = (int(conc_hist[i]) if i < conc_hist.size else 0 for i in range(4))
+    conc_4plus = int(conc_hist[4:].sum())
 
     def pct(x: int) -> float:
         return (x / total_arrivals * 100.0) if total_arrivals else 0.0
 
     # Process vs capacity misses (open hours)
-    missed_open = open_hours_df[open_hours_df["disposition_normalized"].isin(["missed", "abandoned"])].copy()
-    process_misses = int((missed_open["concurrency_at_arrival"] <= 1).sum())
-    capacity_misses = int((missed_open["concurrency_at_arrival"] > 1).sum())
+    conc_missed = conc_arr[open_hours_df["is_missed"].to_numpy(dtype=bool)]
+    process_misses = int((conc_missed <= 1).sum())
+    capacity_misses = int((conc_missed > 1).sum())
     total_misses = process_misses + capacity_misses
     process_pct = (process_misses / total_misses * 100.0) if total_misses else 0.0
     capacity_pct = (capacity_misses / total_misses * 100.0) if total_misses else 0.0
 
     # AHT used (answered open-hours calls) + Monte Carlo
     aht_min = float(analysis_cfg.get("aht_min_minutes", 3.5))
-    answered_open = open_hours_df[open_hours_df["disposition_normalized"] == "answered"]
+    answered_open = open_hours_df[open_hours_df["is_answered"]]
     avg_duration_minutes = float(answered_open["duration_seconds"].mean() / 60.0) if len(answered_open) else aht_min
     aht_used = max(avg_duration_minutes, aht_min)
     aht_lambda = 1.0 / (aht_used * 60.0)
 
-    file_hash = sha256_file(input_path)
+    file_hash = args.input_sha256 or sha256_file(input_path)
     num_sims = int(analysis_cfg.get("num_simulations", 300))
 
     mc_model = str(analysis_cfg.get("mc_duration_model") or "bootstrap_answered").strip().lower()
@@ -1286,50 +1734,40 @@ def main() -> None:
     # v2 headcount basis:
     # - Phones-only (Inbound) uses BASE_FTE (call-time coverage).
     # - RHC + In-house use SHRINKAGE_FTE (accounts for shrinkage).
-    inbound_base = mybcat_weekly_rate * base_fte
-    inbound_ot = mybcat_ot_hourly * base_fte * ot_hours
-    inbound_weekend = weekend_premium * base_fte * weekend_days
-    inbound_weekly = inbound_base + inbound_ot + inbound_weekend
-
+    staffing = {"ot_hours": ot_hours, "weekend_days": weekend_days, "weekend_premium": weekend_premium}
+    inbound = price_option(
+        weekly_rate=mybcat_weekly_rate, ot_hourly=mybcat_ot_hourly, fte_total=base_fte, hourly_fte=base_fte, **staffing
+    )
     rhc_fte_total = shrinkage_fte
-    rhc_base = mybcat_weekly_rate * rhc_fte_total
-    rhc_ot = mybcat_ot_hourly * base_fte * ot_hours
-    rhc_weekend = weekend_premium * base_fte * weekend_days
-    rhc_weekly = rhc_base + rhc_ot + rhc_weekend
+    rhc = price_option(
+        weekly_rate=mybcat_weekly_rate, ot_hourly=mybcat_ot_hourly, fte_total=rhc_fte_total, hourly_fte=base_fte, **staffing
+    )
+    hire = price_option(
+        weekly_rate=inhouse_weekly_rate, ot_hourly=inhouse_ot_hourly, fte_total=shrinkage_fte, hourly_fte=base_fte, **staffing
+    )
+    inbound_weekly, inbound_monthly, inbound_annual = inbound["weekly"], inbound["monthly"], inbound["annual"]
+    rhc_weekly, rhc_monthly, rhc_annual = rhc["weekly"], rhc["monthly"], rhc["annual"]
+    hire_weekly, hire_monthly, hire_annual = hire["weekly"], hire["monthly"], hire["annual"]
 
     rhc_growth_addon_weekly = float(assumptions.get("rhc_growth_addon_weekly", 500))
     rhc_growth_weekly = rhc_weekly + rhc_growth_addon_weekly
-
-    hire_base = inhouse_weekly_rate * shrinkage_fte
-    hire_ot = inhouse_ot_hourly * base_fte * ot_hours
-    hire_weekend = weekend_premium * base_fte * weekend_days
-    hire_weekly = hire_base + hire_ot + hire_weekend
+    rhc_growth_monthly = rhc_growth_weekly * WEEKS_PER_MONTH
+    rhc_growth_annual = rhc_growth_monthly * 12
 
     pilot_fte_total: float | None = None
-    pilot_base: float | None = None
-    pilot_ot: float | None = None
-    pilot_weekend: float | None = None
     pilot_weekly: float | None = None
     pilot_monthly: float | None = None
     pilot_annual: float | None = None
     if pilot_enabled:
         pilot_fte_total = float(pilot_level) if pilot_calc == "base" else float(max(pilot_level / shrink_factor, 1.25))
-        pilot_base = mybcat_weekly_rate * pilot_fte_total
-        pilot_ot = mybcat_ot_hourly * float(pilot_level) * ot_hours
-        pilot_weekend = weekend_premium * float(pilot_level) * weekend_days
-        pilot_weekly = pilot_base + pilot_ot + pilot_weekend
-        pilot_monthly = pilot_weekly * 4.33
-        pilot_annual = pilot_monthly * 12
-
-    inbound_monthly = inbound_weekly * 4.33
-    rhc_monthly = rhc_weekly * 4.33
-    rhc_growth_monthly = rhc_growth_weekly * 4.33
-    hire_monthly = hire_weekly * 4.33
-
-    inbound_annual = inbound_monthly * 12
-    rhc_annual = rhc_monthly * 12
-    rhc_growth_annual = rhc_growth_monthly * 12
-    hire_annual = hire_monthly * 12
+        pilot = price_option(
+            weekly_rate=mybcat_weekly_rate,
+            ot_hourly=mybcat_ot_hourly,
+            fte_total=pilot_fte_total,
+            hourly_fte=float(pilot_level),
+            **staffing,
+        )
+        pilot_weekly, pilot_monthly, pilot_annual = pilot["weekly"], pilot["monthly"], pilot["annual"]
 
     conversion_pct = float(assumptions.get("conversion_pct", 15))
     appt_seeking_pct = float(assumptions.get("appt_seeking_pct", 60))
@@ -1342,7 +1780,7 @@ def main() -> None:
         * (conversion_pct / 100.0)
         * avg_appt_value
     )
-    monthly_leak = weekly_leak * 4.33
+    monthly_leak = weekly_leak * WEEKS_PER_MONTH
     annual_leak = monthly_leak * 12
 
     raw_status_counts = df["disposition_raw"].value_counts(dropna=False).head(6)
@@ -1426,17 +1864,37 @@ def main() -> None:
     # ------------------------------------------------------------------
     # Charts (these filenames are referenced in the Marp template)
     # ------------------------------------------------------------------
-    make_answer_rate_gauge(charts_dir / "answer_rate_gauge.png", answer_rate, grade)
-    make_process_capacity_pie(charts_dir / "miss_distribution.png", process_pct, capacity_pct)
-    make_heatmap(charts_dir / "pain_windows_heatmap.png", miss_rate_matrix)
-    make_hourly_volume(charts_dir / "hourly_volume.png", hourly)
-    make_daily_pattern(charts_dir / "daily_pattern.png", daily)
-    make_fte_coverage(charts_dir / "fte_coverage.png", time_weighted, base_fte, target_coverage)
+    # Each chart draws on its own Figure (OO API, no pyplot state) and Agg releases the GIL
+    # while rasterizing/encoding, so they render side by side. Results are read in order.
+    # A chart whose PNG was rendered from the same inputs and is unchanged on disk (input key + PNG
+    # sha256 in <name>.png.hash) is left as is, so reruns into an existing out dir only redraw what changed.
+    chart_jobs = [
+        (make_answer_rate_gauge, "answer_rate_gauge.png", (answer_rate, grade)),
+        (make_process_capacity_pie, "miss_distribution.png", (process_pct, capacity_pct)),
+        (make_heatmap, "pain_windows_heatmap.png", (miss_rate_matrix,)),
+        (make_hourly_volume, "hourly_volume.png", (hourly,)),
+        (make_daily_pattern, "daily_pattern.png", (daily,)),
+        (make_fte_coverage, "fte_coverage.png", (time_weighted, base_fte, target_coverage)),
+    ]
+    stale_charts = []
+    for make, filename, chart_args in chart_jobs:
+        chart_path = charts_dir / filename
+        key = chart_input_key(make, chart_args)
+        if not chart_is_current(chart_path, key):
+            stale_charts.append((make, chart_path, chart_args, key))
+    if stale_charts:
+        _load_matplotlib()
+        with ThreadPoolExecutor(max_workers=min(4, len(stale_charts))) as executor:
+            charts = [
+                executor.submit(render_chart, make, chart_path, *chart_args, key=key)
+                for make, chart_path, chart_args, key in stale_charts
+            ]
+            for chart in charts:
+                chart.result()
 
     # ------------------------------------------------------------------
     # Deck variables (strings; template already includes $/% around placeholders)
     # ------------------------------------------------------------------
-    location_values = sorted(set(str(x) for x in df["location_name"].dropna().unique() if str(x).strip()))
     location_count = len(location_values) if location_values else 1
     location_list = ", ".join(location_values) if location_values else ""
 
@@ -1476,8 +1934,8 @@ def main() -> None:
 
         "TOTAL_INBOUND": fmt_int(total_inbound),
         "TOTAL_OUTBOUND": fmt_int(total_outbound),
-        "INBOUND_PCT": fmt_pct((total_inbound / total_records * 100.0) if total_records else 0.0, 1),
-        "OUTBOUND_PCT": fmt_pct((total_outbound / total_records * 100.0) if total_records else 0.0, 1),
+        "INBOUND_PCT": fmt_pct(safe_ratio(total_inbound, total_records, 100.0), 1),
+        "OUTBOUND_PCT": fmt_pct(safe_ratio(total_outbound, total_records, 100.0), 1),
 
         "ANSWER_RATE": fmt_pct(answer_rate, 1),
         "ANSWER_RATE_COLOR": answer_rate_color,
@@ -1494,15 +1952,7 @@ def main() -> None:
         "PROCESS_MISS_PCT": fmt_pct(process_pct, 1),
         "CAPACITY_MISS_PCT": fmt_pct(capacity_pct, 1),
 
-        "WORST_HOUR_1": worst_label(worst_1) if worst_1 else "N/A",
-        "WORST_HOUR_1_RATE": fmt_pct(float(worst_1["rate"]), 0) if worst_1 else "0",
-        "WORST_HOUR_1_COUNT": fmt_int(int(worst_1["missed"])) if worst_1 else "0",
-        "WORST_HOUR_2": worst_label(worst_2) if worst_2 else "N/A",
-        "WORST_HOUR_2_RATE": fmt_pct(float(worst_2["rate"]), 0) if worst_2 else "0",
-        "WORST_HOUR_2_COUNT": fmt_int(int(worst_2["missed"])) if worst_2 else "0",
-        "WORST_HOUR_3": worst_label(worst_3) if worst_3 else "N/A",
-        "WORST_HOUR_3_RATE": fmt_pct(float(worst_3["rate"]), 0) if worst_3 else "0",
-        "WORST_HOUR_3_COUNT": fmt_int(int(worst_3["missed"])) if worst_3 else "0",
+        **worst_vars,
 
         "WEEKLY_LEAK": fmt_money(weekly_leak),
         "MONTHLY_LEAK": fmt_money(monthly_leak),
@@ -1526,14 +1976,14 @@ def main() -> None:
         "PILOT_INVESTMENT_ROW": pilot_investment_row,
         "WORLD_CLASS_ANSWER_RATE_LINE": world_class_answer_rate_line,
 
-        "ANSWERED_COUNT": fmt_int(int((inbound_df["disposition_normalized"] == "answered").sum())),
-        "MISSED_COUNT": fmt_int(int(inbound_df["disposition_normalized"].isin(["missed", "abandoned"]).sum())),
-        "ANSWERED_PCT": fmt_pct(((inbound_df["disposition_normalized"] == "answered").sum() / total_records * 100.0) if total_records else 0.0, 1),
-        "MISSED_PCT": fmt_pct((inbound_df["disposition_normalized"].isin(["missed", "abandoned"]).sum() / total_records * 100.0) if total_records else 0.0, 1),
+        "ANSWERED_COUNT": fmt_int(inbound_answered),
+        "MISSED_COUNT": fmt_int(inbound_missed),
+        "ANSWERED_PCT": fmt_pct(safe_ratio(inbound_answered, total_records, 100.0), 1),
+        "MISSED_PCT": fmt_pct(safe_ratio(inbound_missed, total_records, 100.0), 1),
 
-        "AVG_CALLS_DAY": fmt_pct((total_records / days_analyzed) if days_analyzed else 0.0, 1),
-        "AVG_INBOUND_DAY": fmt_pct((total_inbound / days_analyzed) if days_analyzed else 0.0, 1),
-        "AVG_ANSWERED_DAY": fmt_pct((open_answered / days_analyzed) if days_analyzed else 0.0, 1),
+        "AVG_CALLS_DAY": fmt_pct(safe_ratio(total_records, days_analyzed), 1),
+        "AVG_INBOUND_DAY": fmt_pct(safe_ratio(total_inbound, days_analyzed), 1),
+        "AVG_ANSWERED_DAY": fmt_pct(safe_ratio(open_answered, days_analyzed), 1),
         "PEAK_DAY": peak_day,
 
         "BASE_FTE": fmt_pct(float(base_fte), 2),
@@ -1553,7 +2003,7 @@ def main() -> None:
     }
 
     # Populate deck
-    template_text = TEMPLATE_PATH.read_text(encoding="utf-8")
+    template_text = load_template()
     populated = apply_template(template_text, vars_for_deck)
     md_out = out_dir / "presentation.md"
     md_out.write_text(populated, encoding="utf-8")
@@ -1564,88 +2014,59 @@ def main() -> None:
     analysis_manifest = {
         # top-level keys for verify_financials.py
         "BASE_FTE": float(base_fte),
-        "SHRINKAGE_FTE": float(shrinkage_fte),
+        "SHRINKAGE_FTE": shrinkage_fte,
         "PILOT_ENABLED": bool(pilot_enabled),
         "PILOT_LEVEL": int(pilot_level) if pilot_enabled else None,
         "PILOT_CALCULATION": str(pilot_calc) if pilot_enabled else None,
-        "PILOT_ANSWER_RATE": float(pilot_answer_rate) if pilot_enabled else None,
-        "OT_HOURS": float(ot_hours),
+        "PILOT_ANSWER_RATE": pilot_answer_rate if pilot_enabled else None,
+        "OT_HOURS": ot_hours,
         "HAS_SATURDAY": bool(hours_summary["has_saturday"]),
         "HAS_SUNDAY": bool(hours_summary["has_sunday"]),
-        "MYBCAT_WEEKLY_RATE": float(mybcat_weekly_rate),
-        "MYBCAT_OT_HOURLY": float(mybcat_ot_hourly),
-        "INHOUSE_WEEKLY_RATE": float(inhouse_weekly_rate),
-        "INHOUSE_OT_HOURLY": float(inhouse_ot_hourly),
-        "WEEKEND_PREMIUM_PER_DAY": float(weekend_premium),
+        "MYBCAT_WEEKLY_RATE": mybcat_weekly_rate,
+        "MYBCAT_OT_HOURLY": mybcat_ot_hourly,
+        "INHOUSE_WEEKLY_RATE": inhouse_weekly_rate,
+        "INHOUSE_OT_HOURLY": inhouse_ot_hourly,
+        "WEEKEND_PREMIUM_PER_DAY": weekend_premium,
         "OPEN_MISSED": float(open_missed),
-        "WEEKS_IN_RANGE": float(weeks_in_range),
-        "MISSED_CALLS_WEEK": float(missed_per_week),
-        "INBOUND_WEEKLY": float(inbound_weekly),
-        "RHC_WEEKLY": float(rhc_weekly),
-        "RHC_GROWTH_ADDON_WEEKLY": float(rhc_growth_addon_weekly),
-        "RHC_GROWTH_WEEKLY": float(rhc_growth_weekly),
-        "HIRE_WEEKLY": float(hire_weekly),
-        "INBOUND_MONTHLY": float(inbound_monthly),
-        "INBOUND_ANNUAL": float(inbound_annual),
-        "RHC_MONTHLY": float(rhc_monthly),
-        "RHC_ANNUAL": float(rhc_annual),
-        "RHC_GROWTH_MONTHLY": float(rhc_growth_monthly),
-        "RHC_GROWTH_ANNUAL": float(rhc_growth_annual),
-        "HIRE_MONTHLY": float(hire_monthly),
-        "HIRE_ANNUAL": float(hire_annual),
-        "PILOT_WEEKLY": float(pilot_weekly) if pilot_weekly is not None else None,
-        "PILOT_MONTHLY": float(pilot_monthly) if pilot_monthly is not None else None,
-        "PILOT_ANNUAL": float(pilot_annual) if pilot_annual is not None else None,
+        "WEEKS_IN_RANGE": weeks_in_range,
+        "MISSED_CALLS_WEEK": missed_per_week,
+        "INBOUND_WEEKLY": inbound_weekly,
+        "RHC_WEEKLY": rhc_weekly,
+        "RHC_GROWTH_ADDON_WEEKLY": rhc_growth_addon_weekly,
+        "RHC_GROWTH_WEEKLY": rhc_growth_weekly,
+        "HIRE_WEEKLY": hire_weekly,
+        "INBOUND_MONTHLY": inbound_monthly,
+        "INBOUND_ANNUAL": inbound_annual,
+        "RHC_MONTHLY": rhc_monthly,
+        "RHC_ANNUAL": rhc_annual,
+        "RHC_GROWTH_MONTHLY": rhc_growth_monthly,
+        "RHC_GROWTH_ANNUAL": rhc_growth_annual,
+        "HIRE_MONTHLY": hire_monthly,
+        "HIRE_ANNUAL": hire_annual,
+        "PILOT_WEEKLY": pilot_weekly,
+        "PILOT_MONTHLY": pilot_monthly,
+        "PILOT_ANNUAL": pilot_annual,
         "pricing": {
-            "weeks_per_month": 4.33,
-            "weekend_days": int(weekend_days),
-            "inbound": {
-                "base": float(inbound_base),
-                "ot": float(inbound_ot),
-                "weekend": float(inbound_weekend),
-                "weekly": float(inbound_weekly),
-                "monthly": float(inbound_monthly),
-                "annual": float(inbound_annual),
-            },
-            "rhc": {
-                "fte_total": float(rhc_fte_total),
-                "base": float(rhc_base),
-                "ot": float(rhc_ot),
-                "weekend": float(rhc_weekend),
-                "weekly": float(rhc_weekly),
-                "monthly": float(rhc_monthly),
-                "annual": float(rhc_annual),
-            },
+            "weeks_per_month": WEEKS_PER_MONTH,
+            "weekend_days": weekend_days,
+            "inbound": inbound,
+            "rhc": {"fte_total": rhc_fte_total, **rhc},
             "rhc_growth": {
-                "fte_total": float(rhc_fte_total),
-                "base": float(rhc_base),
-                "ot": float(rhc_ot),
-                "weekend": float(rhc_weekend),
-                "growth_addon_weekly": float(rhc_growth_addon_weekly),
-                "weekly": float(rhc_growth_weekly),
-                "monthly": float(rhc_growth_monthly),
-                "annual": float(rhc_growth_annual),
-            },
-            "in_house": {
-                "base": float(hire_base),
-                "ot": float(hire_ot),
-                "weekend": float(hire_weekend),
-                "weekly": float(hire_weekly),
-                "monthly": float(hire_monthly),
-                "annual": float(hire_annual),
+                **rhc,
+                "fte_total": rhc_fte_total,
+                "growth_addon_weekly": rhc_growth_addon_weekly,
+                "weekly": rhc_growth_weekly,
+                "monthly": rhc_growth_monthly,
+                "annual": rhc_growth_annual,
             },
+            "in_house": hire,
             "pilot": (
                 {
                     "base_hc": int(pilot_level),
                     "calculation": str(pilot_calc),
-                    "answer_rate": float(pilot_answer_rate),
-                    "fte_total": float(pilot_fte_total) if pilot_fte_total is not None else None,
-                    "base": float(pilot_base) if pilot_base is not None else None,
-                    "ot": float(pilot_ot) if pilot_ot is not None else None,
-                    "weekend": float(pilot_weekend) if pilot_weekend is not None else None,
-                    "weekly": float(pilot_weekly) if pilot_weekly is not None else None,
-                    "monthly": float(pilot_monthly) if pilot_monthly is not None else None,
-                    "annual": float(pilot_annual) if pilot_annual is not None else None,
+                    "answer_rate": pilot_answer_rate,
+                    "fte_total": pilot_fte_total,
+                    **pilot,
                 }
                 if pilot_enabled
                 else None
@@ -1673,7 +2094,7 @@ def main() -> None:
                 "max_redirected_pct": max_redirected_pct,
                 "stop_on_low_confidence": stop_on_low_confidence,
             },
-            "closures": sorted(d.isoformat() for d in closure_set),
+            "closures": closure_days,
             "deck_text": {
                 "disposition_method_full": disposition_method_full,
                 "methodology_caveat_full": methodology_caveat_full,
@@ -1681,21 +2102,14 @@ def main() -> None:
             "mapping_report": mapping_report,
             "mapping_issues": mapping_issues,
         },
-        "mapping": {
-            "location": col_location,
-            "start_time": col_start,
-            "end_time": col_end,
-            "duration": col_dur,
-            "direction": col_dir,
-            "status": col_status,
-        },
+        "mapping": column_mapping,
         "metrics": {
             "days_analyzed": days_analyzed,
             "weeks_in_range": weeks_in_range,
             "total_inbound": total_inbound,
             "total_outbound": total_outbound,
             "open_inbound": int(len(open_hours_df)),
-            "closed_inbound": int(len(closed_hours_df)),
+            "closed_inbound": closed_inbound,
             "open_answer_rate": answer_rate,
             "open_miss_rate": miss_rate,
             "grade": grade,
@@ -1717,13 +2131,23 @@ def main() -> None:
     }
 
     manifest_path = out_dir / "analysis_manifest.json"
-    write_json(manifest_path, analysis_manifest)
 
     # ------------------------------------------------------------------
     # Checks & balances: financial verification + Marp render verification
     # ------------------------------------------------------------------
-    run_cmd(["python", str(VERIFY_FINANCIALS), str(manifest_path.resolve())], cwd=ROOT)
-    run_cmd(["python", str(RENDER_VERIFY), str(md_out.resolve())], cwd=ROOT)
+    # The financial checks run in-process on the manifest dict (no interpreter spawn or JSON
+    # reload). Once they pass, the Marp render verifier (reads only the deck and charts) runs
+    # in its own process while the manifest is written; a rejected run is never rendered.
+    issues, _ = verify_manifest(analysis_manifest)
+    critical = [i for i in issues if i.level == "CRITICAL"]
+    with ThreadPoolExecutor(max_workers=1) as render_pool:
+        render_check = None
+        if not critical:
+            render_check = render_pool.submit(run_cmd, ["python", str(RENDER_VERIFY), str(md_out.absolute())], cwd=ROOT)
+        write_json(manifest_path, analysis_manifest)
+        if critical:
+            raise RuntimeError("Financial verification failed:\n" + "\n".join(f"- [{i.level}] {i.message}" for i in issues))
+        render_check.result()
 
     print("[OK] Pipeline run complete")
     print(f"[OK] Gold: {gold_path}")